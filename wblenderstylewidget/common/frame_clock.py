@@ -0,0 +1,94 @@
+# coding:utf-8
+import time
+from typing import Callable, Dict
+
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, Qt, QTimer
+from PyQt5.QtGui import QGuiApplication
+
+class FrameClock(QObject):
+    """ Process-wide clock ticking once per display frame while it has work
+
+    `requestFrame` runs a callback once on the next frame, however many times
+    it is requested before, so input arriving faster than the display, e.g.
+    from a 1000 Hz mouse, is applied at most once per frame. `addListener`
+    runs a callback on every frame until it is removed, for animations. The
+    clock stops as soon as nothing is pending.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._requests = {}     # type: Dict[Callable, None]
+        self._listeners = {}    # type: Dict[Callable, None]
+        self._lastFrame = 0.0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+        self.frameRate = None
+
+    def interval(self) -> float:
+        """ the frame interval in seconds, the refresh rate of the primary screen by default """
+        rate = self.frameRate
+        if rate is None:
+            screen = QGuiApplication.primaryScreen()
+            rate = screen.refreshRate() if screen is not None else 0
+        return 1 / (rate if rate > 0 else 60)
+
+    def requestFrame(self, callback: Callable[[], None]):
+        """ run `callback` once on the next frame """
+        self._requests[callback] = None
+        self._schedule()
+
+    def cancelFrame(self, callback: Callable[[], None]):
+        self._requests.pop(callback, None)
+
+    def isFramePending(self, callback: Callable[[], None]) -> bool:
+        return callback in self._requests
+
+    def addListener(self, callback: Callable[[float], None]):
+        """ run `callback` on every frame with the seconds elapsed since the previous frame """
+        self._listeners[callback] = None
+        self._schedule()
+
+    def removeListener(self, callback: Callable[[float], None]):
+        self._listeners.pop(callback, None)
+
+    def hasListener(self, callback: Callable[[float], None]) -> bool:
+        return callback in self._listeners
+
+    def _schedule(self):
+        if self._timer.isActive():
+            return
+        # an idle clock ticks right away, a running one keeps its frame rate
+        remaining = self.interval() - (time.perf_counter() - self._lastFrame)
+        self._timer.start(max(0, round(remaining * 1000)))
+
+    def _tick(self):
+        now = time.perf_counter()
+        elapsed = now - self._lastFrame
+        if elapsed > 4 * self.interval():
+            # the clock was idle, count a single frame
+            elapsed = self.interval()
+        self._lastFrame = now
+
+        requests, self._requests = self._requests, {}
+        for callback in requests:
+            if self._isAlive(callback):
+                callback()
+        for callback in list(self._listeners):
+            if not self._isAlive(callback):
+                self._listeners.pop(callback, None)
+            elif callback in self._listeners:
+                callback(elapsed)
+
+        if self._requests or self._listeners:
+            self._schedule()
+
+    @staticmethod
+    def _isAlive(callback: Callable) -> bool:
+        """ callbacks bound to a deleted Qt object are dropped """
+        owner = getattr(callback, "__self__", None)
+        return not (isinstance(owner, sip.simplewrapper) and sip.isdeleted(owner))
+
+frameClock = FrameClock()
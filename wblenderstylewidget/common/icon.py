@@ -1,17 +1,139 @@
-from PyQt5.QtGui import QIcon
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple, Union
+
+from PyQt5.QtCore import QRectF, QSize, Qt
+from PyQt5.QtGui import QColor, QIcon, QImage, QPainter, QPixmap
+from PyQt5.QtSvg import QSvgRenderer
+
+from .resource import resourcePath
 
 class BlenderStyleIcon:
-    CHECK = "wblenderstylewidget/resources/icons/icon_check.svg"
-    CLOSE = "wblenderstylewidget/resources/icons/icon_close.svg"
-    LEFTARROWHEAD = "wblenderstylewidget/resources/icons/icon_leftarrowhead.svg"
-    RIGHTARROWHEAD = "wblenderstylewidget/resources/icons/icon_rightarrowhead.svg"
-    SEARCH = "wblenderstylewidget/resources/icons/icon_search.svg"
+    CHECK = resourcePath("resources/icons/icon_check.svg")
+    CLOSE = resourcePath("resources/icons/icon_close.svg")
+    LEFTARROWHEAD = resourcePath("resources/icons/icon_leftarrowhead.svg")
+    RIGHTARROWHEAD = resourcePath("resources/icons/icon_rightarrowhead.svg")
+    SEARCH = resourcePath("resources/icons/icon_search.svg")
 
     def __getattribute__(self, name):
         value = super(BlenderStyleIcon, self).__getattribute__(name)
         if name is not None:
             if isinstance(value, str):
-                return QIcon(value)
+                return iconRegistry.icon(value)
             else:
                 return value
-        return value
\ No newline at end of file
+        return value
+
+    @classmethod
+    def paths(cls) -> Dict[str, str]:
+        """ every icon name with its path """
+        return {name: value for name, value in vars(cls).items()
+                if name.isupper() and isinstance(value, str)}
+
+class IconRegistry:
+    """ Process-wide cache of icons and of their rasterized pixmaps
+
+    Each icon file is loaded and parsed once. Pixmaps are rendered once per
+    (icon, size, device pixel ratio, tint color) and kept in a LRU cache of
+    at most `maxPixmaps` entries.
+    """
+
+    def __init__(self, maxPixmaps: int = 256):
+        self.maxPixmaps = maxPixmaps
+        self._icons = {}            # type: Dict[str, QIcon]
+        self._renderers = {}        # type: Dict[str, QSvgRenderer]
+        self._pixmaps = OrderedDict()   # type: OrderedDict[Tuple, QPixmap]
+        self.resetStats()
+
+    def icon(self, icon: Union[str, QIcon, None]) -> QIcon:
+        """ return the shared QIcon of a path, QIcon and None are passed through """
+        if icon is None:
+            return QIcon()
+        if isinstance(icon, QIcon):
+            return icon
+
+        cached = self._icons.get(icon)
+        if cached is not None:
+            self.iconHits += 1
+            return cached
+        self.iconMisses += 1
+        cached = self._icons[icon] = QIcon(icon)
+        return cached
+
+    def pixmap(self, icon: str, size: Union[int, QSize], devicePixelRatio: float = 1.0,
+               color: Union[str, QColor] = None) -> QPixmap:
+        """ return the pixmap of `icon` at `size`, optionally tinted with `color` """
+        if isinstance(size, int):
+            size = QSize(size, size)
+        color = QColor(color).name(QColor.NameFormat.HexArgb) if color is not None else None
+        key = (icon, size.width(), size.height(), devicePixelRatio, color)
+
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmapHits += 1
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        self.pixmapMisses += 1
+        pixmap = self._pixmaps[key] = self._render(icon, size, devicePixelRatio, color)
+        while len(self._pixmaps) > self.maxPixmaps:
+            self._pixmaps.popitem(last=False)
+            self.evictions += 1
+        return pixmap
+
+    def preload(self, icons: Iterable[str] = None, sizes: Iterable[Union[int, QSize]] = (),
+                devicePixelRatio: float = 1.0):
+        """ load the icons, all Blender style icons by default, and render them at `sizes` """
+        for icon in icons or BlenderStyleIcon.paths().values():
+            self.icon(icon)
+            for size in sizes:
+                self.pixmap(icon, size, devicePixelRatio)
+
+    def clear(self):
+        self._icons.clear()
+        self._renderers.clear()
+        self._pixmaps.clear()
+
+    def resetStats(self):
+        self.iconHits = 0
+        self.iconMisses = 0
+        self.pixmapHits = 0
+        self.pixmapMisses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """ return the hit, miss and eviction counters of the registry """
+        return {
+            "icons": len(self._icons),
+            "iconHits": self.iconHits,
+            "iconMisses": self.iconMisses,
+            "pixmaps": len(self._pixmaps),
+            "pixmapHits": self.pixmapHits,
+            "pixmapMisses": self.pixmapMisses,
+            "evictions": self.evictions,
+        }
+
+    def _render(self, icon: str, size: QSize, devicePixelRatio: float, color: str) -> QPixmap:
+        image = QImage(size * devicePixelRatio, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+        if icon.lower().endswith(".svg"):
+            renderer = self._renderers.get(icon)
+            if renderer is None:
+                renderer = self._renderers[icon] = QSvgRenderer(icon)
+            renderer.render(painter, QRectF(image.rect()))
+        else:
+            painter.drawPixmap(image.rect(), self.icon(icon).pixmap(image.size()))
+
+        if color is not None:
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+            painter.fillRect(image.rect(), QColor(color))
+        painter.end()
+
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(devicePixelRatio)
+        return pixmap
+
+iconRegistry = IconRegistry()
@@ -0,0 +1,143 @@
+# coding:utf-8
+import atexit
+import os
+import pathlib
+import shutil
+import tempfile
+from importlib import resources
+from typing import Dict, Iterable, List
+
+from PyQt5.QtCore import QFile, QIODevice, QResource
+
+QRC_PREFIX = "/wblenderstylewidget"
+
+# the package root, found relative to this module so it does not depend on the
+# current working directory, a directory on disk or a folder of a zip archive
+_PACKAGE_ROOT = resources.files(__package__).parent
+
+_paths = {}     # type: Dict[str, str]
+# the folders of a zipped package extracted to disk, removed on exit
+_extractedFolders = {}     # type: Dict[str, str]
+_bundleRegistered = None
+
+def isBundleRegistered() -> bool:
+    """ whether the assets are served from a registered Qt resource bundle """
+    global _bundleRegistered
+    if _bundleRegistered is None:
+        _bundleRegistered = QFile.exists(f":{QRC_PREFIX}/styles/button.qss")
+    return _bundleRegistered
+
+def registerResourceBundle(path: str = None) -> bool:
+    """ Serve every style sheet and icon from a Qt resource bundle
+
+    `path` is a binary bundle built by `rcc -binary` from the collection
+    written by `writeResourceCollection`. Without a path, a bundle already
+    registered by importing a `pyrcc5` generated module is picked up.
+    """
+    global _bundleRegistered
+    if path is not None and not QResource.registerResource(path):
+        raise FileNotFoundError(f"Resource bundle could not be registered: {path}")
+
+    _bundleRegistered = None
+    _paths.clear()
+    return isBundleRegistered()
+
+def resourcePath(relative: str) -> str:
+    """ Return a path Qt can open for a package asset, e.g. "styles/button.qss"
+
+    Inside a registered bundle this is a `:/` resource path, otherwise the file
+    or folder in the installed package. When the package is zipped, the folder
+    of the asset is extracted once as a whole, so that a style sheet referring
+    to a folder, e.g. `@icons`, finds the files of that folder in it.
+    Register a bundle before creating widgets, resolved paths are cached.
+    """
+    path = _paths.get(relative)
+    if path is None:
+        if isBundleRegistered():
+            path = f":{QRC_PREFIX}/{relative}"
+        else:
+            path = os.path.normpath(_localPath(relative)).replace(os.sep, "/")
+        _paths[relative] = path
+    return path
+
+def _localPath(relative: str) -> str:
+    """ the path on disk of a package asset, extracting its folder from a zip archive """
+    traversable = _PACKAGE_ROOT.joinpath(*relative.split("/"))
+    if isinstance(traversable, pathlib.Path):
+        return str(traversable)
+    if not traversable.is_file() and not traversable.is_dir():
+        raise FileNotFoundError(f"Resource not found: {relative}")
+
+    if traversable.is_dir():
+        folder, name = relative, ""
+    else:
+        folder, _, name = relative.rpartition("/")
+    directory = _extractedFolders.get(folder)
+    if directory is None:
+        directory = _extractedFolders[folder] = tempfile.mkdtemp(prefix="wblenderstylewidget-")
+        atexit.register(shutil.rmtree, directory, ignore_errors=True)
+        _extractFolder(_PACKAGE_ROOT.joinpath(*folder.split("/")) if folder else _PACKAGE_ROOT, directory)
+    return os.path.join(directory, name) if name else directory
+
+def _extractFolder(folder, directory: str):
+    for entry in folder.iterdir():
+        target = os.path.join(directory, entry.name)
+        if entry.is_dir():
+            os.makedirs(target, exist_ok=True)
+            _extractFolder(entry, target)
+        else:
+            with open(target, 'wb') as file:
+                file.write(entry.read_bytes())
+
+def readResource(path: str) -> str:
+    """ Read the text of a file or of a `:/` resource """
+    if path.startswith(":"):
+        file = QFile(path)
+        if not file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+            raise FileNotFoundError(f"Resource not found: {path}")
+        try:
+            return bytes(file.readAll()).decode("utf-8")
+        finally:
+            file.close()
+
+    with open(path, 'r', encoding='utf-8') as file:
+        return file.read()
+
+def resourceExists(path: str) -> bool:
+    return QFile.exists(path) if path.startswith(":") else os.path.exists(path)
+
+def resourceMtime(path: str) -> float:
+    """ Modification time of a file, resources in a bundle never change """
+    if path.startswith(":"):
+        return 0
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return -1
+
+def resourceVariables() -> Dict[str, str]:
+    """ qss variables locating the asset folders, e.g. `url("@icons/icon_check.svg")` """
+    return {"icons": resourcePath("resources/icons")}
+
+def resourceFiles() -> List[str]:
+    """ Every asset of the package, relative to the package root """
+    files = []
+    for folder in ("styles", "resources/icons"):
+        directory = _PACKAGE_ROOT.joinpath(*folder.split("/"))
+        files.extend(f"{folder}/{entry.name}" for entry in directory.iterdir()
+                     if entry.name.endswith((".qss", ".svg")))
+    return sorted(files)
+
+def writeResourceCollection(path: str, files: Iterable[str] = None) -> str:
+    """ Write a .qrc collection of the assets, to be compiled with rcc or pyrcc5 """
+    directory = os.path.dirname(os.path.abspath(path))
+    lines = ["<!DOCTYPE RCC>", '<RCC version="1.0">', f'<qresource prefix="{QRC_PREFIX}">']
+    for relative in files or resourceFiles():
+        source = os.path.relpath(resourcePath(relative), directory).replace(os.sep, "/")
+        lines.append(f'    <file alias="{relative}">{source}</file>')
+    lines += ["</qresource>", "</RCC>", ""]
+
+    os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("\n".join(lines))
+    return path
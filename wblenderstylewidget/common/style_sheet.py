@@ -1,14 +1,25 @@
 # coding:utf-8
 from enum import Enum
-from typing import List, Union
+from typing import Callable, Dict, Hashable, Iterable, List, Tuple, Union
 import os
+import re
+import weakref
 
-from PyQt5.QtWidgets import QWidget
+from PyQt5 import sip
+from PyQt5.QtCore import QFileSystemWatcher, QObject, Qt, QTimer
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from .resource import readResource, resourceExists, resourceMtime, resourcePath
+from .theme import parseStyleSheet, themeManager
 
 class BaseStyleSheet:
     def path(self):
         raise NotImplementedError
-    
+
+    def content(self):
+        """ get the style sheet text compiled for the current theme """
+        return themeManager.compile(styleSheetCache.get(self))
+
     def apply(self, widget: QWidget):
         """ apply style sheet to widget """
         setStyleSheet(widget, self)
@@ -21,22 +32,388 @@ class BlenderStyleSheet(BaseStyleSheet, Enum):
     EXPANDABLELAYOUT = "expandablelayout"
     LINEEDIT = "lineedit"
     LISTWIDGET = "listwidget"
+    LISTVIEW = "listview"
     PROGRESSBAR = "progressbar"
     SCROLLAREA = "scrollarea"
     SPINBOX = "spinbox"
     SWITCHBUTTON = "switchbutton"
     TOOLTIP = "tooltip"
-    
+
     def path(self):
-        return f"wblenderstylewidget\\styles\\{self.value}.qss"
-    
+        return resourcePath(f"styles/{self.value}.qss")
+
+class StyleSheetCache:
+    """ Process-wide cache of the style sheet text, keyed by style sheet member
+
+    Every widget applying the same style sheet shares one read of the qss file.
+    The modification time of the file is checked on each lookup so edited
+    files are picked up again, unless `checkModified` is turned off.
+    """
+
+    def __init__(self, checkModified: bool = True):
+        self.checkModified = checkModified
+        self._cache = {}    # type: Dict[BaseStyleSheet, Tuple[float, str]]
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, stylesheet: BaseStyleSheet) -> str:
+        """ return the qss text of `stylesheet`, reading the file only on a miss """
+        cached = self._cache.get(stylesheet)
+        if cached is not None:
+            if not self.checkModified or cached[0] == self._mtime(stylesheet):
+                self.hits += 1
+                return cached[1]
+
+        self.misses += 1
+        qss_path = stylesheet.path()
+        if not resourceExists(qss_path):
+            raise FileNotFoundError(f"QSS file not found: {qss_path}")
+
+        mtime = self._mtime(stylesheet)
+        qss_text = readResource(qss_path)
+        self._cache[stylesheet] = (mtime, qss_text)
+        return qss_text
+
+    def preload(self, stylesheets: Iterable[BaseStyleSheet] = BlenderStyleSheet):
+        """ read the given style sheets ahead of time, all Blender style sheets by default """
+        for stylesheet in stylesheets:
+            if stylesheet not in self._cache:
+                self.get(stylesheet)
+
+    def invalidate(self, stylesheet: BaseStyleSheet = None):
+        """ drop `stylesheet` from the cache, or everything when it is None """
+        if stylesheet is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(stylesheet, None)
+
+    def resetStats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """ return the hit, miss and entry counters of the cache """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._cache)}
+
+    @staticmethod
+    def _mtime(stylesheet: BaseStyleSheet) -> float:
+        return resourceMtime(stylesheet.path())
+
+styleSheetCache = StyleSheetCache()
+
+class StyleSheetMode(Enum):
+    """ How `BaseStyleSheet.apply` styles a widget """
+    WIDGET = "widget"
+    APPLICATION = "application"
+
+class ApplicationStyleSheet:
+    """ Single application style sheet merged from every style sheet
+
+    Each style sheet is scoped by a dynamic property selector and merged once
+    into the application style sheet, so applying a style sheet to a widget is
+    only a property assignment instead of a per-instance qss parse.
+    """
+
+    PROPERTY = "blenderStyleSheet"
+
+    def __init__(self):
+        self.mode = StyleSheetMode.WIDGET
+        self._stylesheets = list(BlenderStyleSheet)     # type: List[BaseStyleSheet]
+        self._sections = {}     # type: Dict[str, str]
+        self._merged = None
+        self._installed = ""
+        self._dirty = True
+        self._installScheduled = False
+
+    def isEnabled(self) -> bool:
+        return self.mode == StyleSheetMode.APPLICATION
+
+    def addStyleSheet(self, stylesheet: BaseStyleSheet):
+        """ merge a custom style sheet in addition to the Blender style sheets """
+        if stylesheet not in self._stylesheets:
+            self._stylesheets.append(stylesheet)
+            self._dirty = True
+
+    def setSection(self, key: str, qss: str):
+        """ merge an extra, already scoped qss block identified by `key` """
+        if self._sections.get(key) != qss:
+            self._sections[key] = qss
+            self._dirty = True
+
+    def removeSection(self, key: str):
+        if self._sections.pop(key, None) is not None:
+            self._dirty = True
+
+    def invalidate(self):
+        """ rebuild the merged style sheet on the next install """
+        self._merged = None
+        self._dirty = True
+
+    def merged(self) -> str:
+        """ return the merged and scoped text of every style sheet """
+        if self._merged is None:
+            scoped = (scopeStyleSheet(stylesheet.content(), self.scopeName(stylesheet))
+                      for stylesheet in self._stylesheets)
+            self._merged = "\n".join(filter(None, scoped))
+        return "\n".join(filter(None, [self._merged, *self._sections.values()]))
+
+    def install(self):
+        """ set the merged style sheet on the application, keeping its own style sheet """
+        app = QApplication.instance()
+        if app is None:
+            raise RuntimeError("ApplicationStyleSheet requires a QApplication instance")
+
+        base = app.styleSheet()
+        if self._installed and base.endswith(self._installed):
+            base = base[:-len(self._installed)]
+
+        merged = self.merged()
+        self._installed = "\n" + merged if merged else ""
+        self._dirty = False
+        if app.styleSheet() != base + self._installed:
+            app.setStyleSheet(base + self._installed)
+
+    def scheduleInstall(self):
+        """ install the pending changes once the control returns to the event loop, in application mode """
+        if self._dirty and self.isEnabled() and not self._installScheduled:
+            self._installScheduled = True
+            QTimer.singleShot(0, self._installPending)
+
+    def _installPending(self):
+        self._installScheduled = False
+        if self._dirty and self.isEnabled():
+            self.install()
+
+    def apply(self, widget: QWidget, stylesheet: BaseStyleSheet):
+        """ tag `widget` with the scope of `stylesheet` """
+        self.addStyleSheet(stylesheet)
+        if self._dirty:
+            self.install()
+        widget.setProperty(self.PROPERTY, self.scopeName(stylesheet))
+
+    def styleSheets(self) -> List[BaseStyleSheet]:
+        return list(self._stylesheets)
+
+    def styleSheet(self, name: str) -> BaseStyleSheet:
+        """ return the style sheet whose scope is `name` """
+        for stylesheet in self._stylesheets:
+            if self.scopeName(stylesheet) == name:
+                return stylesheet
+        return None
+
+    @staticmethod
+    def scopeName(stylesheet: BaseStyleSheet) -> str:
+        return stylesheet.value if isinstance(stylesheet, Enum) else type(stylesheet).__name__
+
+applicationStyleSheet = ApplicationStyleSheet()
+
+def setStyleSheetMode(mode: StyleSheetMode):
+    """ Choose between per-widget style sheets and one merged application style sheet
+
+    Switch the mode before the widgets are created, widgets styled in the
+    other mode keep their current style sheet.
+    """
+    applicationStyleSheet.mode = mode
+    if mode == StyleSheetMode.APPLICATION:
+        applicationStyleSheet.install()
+
+def styleSheetMode() -> StyleSheetMode:
+    return applicationStyleSheet.mode
+
+_COMPOUND_PATTERN = re.compile(r"^([^\s>:]*)(.*)$", re.S)
+
+def scopeSelector(selector: str, name: str, property: str = ApplicationStyleSheet.PROPERTY) -> str:
+    """ Restrict `selector` to widgets tagged with `name` and their children """
+    attribute = f'[{property}="{name}"]'
+    head, tail = _COMPOUND_PATTERN.match(selector).groups()
+    return f"{head or '*'}{attribute}{tail},*{attribute} {selector}"
+
+def scopeStyleSheet(qss: str, name: str, property: str = ApplicationStyleSheet.PROPERTY) -> str:
+    """ Scope every rule of `qss` with `scopeSelector` """
+    rules = []
+    for selectors, declarations in parseStyleSheet(qss):
+        scoped = ",".join(scopeSelector(s, name, property) for s in selectors)
+        body = ";".join(f"{key}:{value}" for key, value in declarations)
+        rules.append(f"{scoped}{{{body}}}")
+    return "".join(rules)
+
+# the widgets given their own style sheet, restyled when the theme changes
+_styledWidgets = {}     # type: Dict[BaseStyleSheet, weakref.WeakSet]
+
 def setStyleSheet(widget: QWidget, stylesheet: 'BaseStyleSheet'):
     """ Helper function to set the style sheet to the widget """
-    qss_path = stylesheet.path()
-    if os.path.exists(qss_path):
-        with open(qss_path, 'r', encoding='utf-8') as file:
-            qss_text = file.read()
-            widget.setStyleSheet(qss_text)
-            return qss_text
+    qss_text = stylesheet.content()
+    if applicationStyleSheet.isEnabled():
+        applicationStyleSheet.apply(widget, stylesheet)
     else:
-        raise FileNotFoundError(f"QSS file not found: {qss_path}")
\ No newline at end of file
+        applicationStyleSheet.addStyleSheet(stylesheet)
+        widget.setProperty(ApplicationStyleSheet.PROPERTY, applicationStyleSheet.scopeName(stylesheet))
+        widget.setStyleSheet(qss_text)
+        _styledWidgets.setdefault(stylesheet, weakref.WeakSet()).add(widget)
+    return qss_text
+
+class StyleClassRegistry:
+    """ Interns identical generated style sheets into shared style classes
+
+    Widgets generating the same qss share one class: its rules are merged once
+    into the application style sheet under a dynamic property selector, and
+    each widget only carries the property. Requires the application mode,
+    where the style sheets of the widget hierarchy are merged in the same
+    application style sheet; in widget mode a widget carries its own style
+    sheet, which ranks above those of its ancestors and of the application.
+
+    Each new class costs a repolish of the application on the next install,
+    so the classes known up front should be interned with `intern` before
+    the widgets are built.
+    """
+
+    PROPERTY = "styleClass"
+
+    def __init__(self):
+        self._names = {}        # type: Dict[Hashable, str]
+        self._factories = {}    # type: Dict[str, Callable[[str], str]]
+
+    def intern(self, key: Hashable, createStyleSheet: Callable[[str], str]) -> str:
+        """ return the class of `key`, registering `createStyleSheet(selector)` the first time """
+        name = self._names.get(key)
+        if name is None:
+            name = self._names[key] = f"c{len(self._names)}"
+            self._factories[name] = createStyleSheet
+            self._register(name)
+        return name
+
+    def apply(self, widget: QWidget, key: Hashable, createStyleSheet: Callable[[str], str]) -> str:
+        """ tag `widget` with the shared class of `key`, installing the new classes on the next turn """
+        name = self.intern(key, createStyleSheet)
+        applicationStyleSheet.scheduleInstall()
+        if widget.property(self.PROPERTY) != name:
+            widget.setProperty(self.PROPERTY, name)
+            self._repolish(widget)
+        return name
+
+    def remove(self, widget: QWidget):
+        """ untag `widget` """
+        if widget.property(self.PROPERTY) is not None:
+            widget.setProperty(self.PROPERTY, None)
+            self._repolish(widget)
+
+    def rebuild(self):
+        """ regenerate the rules of every class, e.g. for a new theme """
+        for name in self._factories:
+            self._register(name)
+
+    def classCount(self) -> int:
+        return len(self._names)
+
+    def stats(self, widgetType: type = QWidget) -> Dict[str, int]:
+        """ count the live instances of `widgetType` and the classes they use """
+        app = QApplication.instance()
+        widgets = [w for w in app.allWidgets() if isinstance(w, widgetType)] if app else []
+        used = [w.property(self.PROPERTY) for w in widgets]
+        used = [name for name in used if name]
+        return {"classes": len(set(used)), "instances": len(used), "registered": len(self._names)}
+
+    @staticmethod
+    def _repolish(widget: QWidget):
+        if widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    def _register(self, name: str):
+        selector = f'[{self.PROPERTY}="{name}"]'
+        applicationStyleSheet.setSection(f"{self.PROPERTY}:{name}", self._factories[name](selector))
+
+styleClassRegistry = StyleClassRegistry()
+
+def reapplyStyleSheets():
+    """ Restyle every styled widget, e.g. after the theme or a qss file changed
+
+    In application mode the style classes are rebuilt in one install of the
+    application style sheet, which restyles everything. Otherwise the widgets
+    styled by `setStyleSheet` get their text again, without visiting the
+    other widgets.
+    """
+    applicationStyleSheet.invalidate()
+    styleClassRegistry.rebuild()
+    app = QApplication.instance()
+    if app is None:
+        return
+    if applicationStyleSheet.isEnabled():
+        applicationStyleSheet.install()
+        return
+
+    for stylesheet, widgets in _styledWidgets.items():
+        name = applicationStyleSheet.scopeName(stylesheet)
+        qss = stylesheet.content()
+        for widget in list(widgets):
+            # a widget restyled since, or styled in application mode, is dropped
+            if sip.isdeleted(widget) or widget.property(ApplicationStyleSheet.PROPERTY) != name:
+                widgets.discard(widget)
+            elif widget.styleSheet() != qss:
+                widget.setStyleSheet(qss)
+
+themeManager.themeChanged.connect(reapplyStyleSheets)
+
+class StyleSheetWatcher(QObject):
+    """ Reload the qss files when they change on disk, for development
+
+    Bursts of file change notifications, as produced by editors saving a
+    file, are debounced into a single reload after `delay` milliseconds.
+    """
+
+    def __init__(self, delay: int = 200, parent=None):
+        super().__init__(parent)
+        self._changedPaths = set()
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._onFileChanged)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._reload)
+
+    def setDelay(self, delay: int):
+        self._timer.setInterval(delay)
+
+    def watch(self, stylesheets: Iterable[BaseStyleSheet] = BlenderStyleSheet):
+        paths = [stylesheet.path() for stylesheet in stylesheets]
+        # resources inside a Qt resource bundle can not change
+        paths = [path for path in paths if not path.startswith(":")
+                 and os.path.exists(path) and path not in self._watcher.files()]
+        if paths:
+            self._watcher.addPaths(paths)
+
+    def unwatch(self):
+        if self._watcher.files():
+            self._watcher.removePaths(self._watcher.files())
+
+    def _onFileChanged(self, path: str):
+        self._changedPaths.add(path)
+        self._timer.start()
+
+    def _reload(self):
+        changed, self._changedPaths = self._changedPaths, set()
+        for path in changed:
+            # editors often replace the file, which removes it from the watcher
+            if os.path.exists(path) and path not in self._watcher.files():
+                self._watcher.addPath(path)
+
+        for stylesheet in applicationStyleSheet.styleSheets():
+            if stylesheet.path() in changed:
+                styleSheetCache.invalidate(stylesheet)
+        themeManager.invalidate()
+        reapplyStyleSheets()
+
+_styleSheetWatcher = None
+
+def setHotReloadEnabled(enabled: bool, delay: int = 200):
+    """ Watch the qss files and restyle the widgets when one of them is saved """
+    global _styleSheetWatcher
+    if enabled:
+        if _styleSheetWatcher is None:
+            _styleSheetWatcher = StyleSheetWatcher(delay)
+        _styleSheetWatcher.setDelay(delay)
+        _styleSheetWatcher.watch(applicationStyleSheet.styleSheets())
+    elif _styleSheetWatcher is not None:
+        _styleSheetWatcher.unwatch()
+        _styleSheetWatcher.deleteLater()
+        _styleSheetWatcher = None
@@ -0,0 +1,187 @@
+# coding:utf-8
+import hashlib
+import os
+import re
+from typing import Dict, List, Mapping, Tuple
+
+from PyQt5.QtCore import QObject, QStandardPaths, pyqtSignal
+from PyQt5.QtGui import QColor
+
+from .resource import resourceVariables
+
+class Theme:
+    """ Named table of the variables referenced by templated qss
+
+    A qss template refers to a variable as `@name`, Python code resolves the
+    same references with `resolve` and `color`.
+    """
+
+    def __init__(self, name: str, variables: Dict[str, str]):
+        self.name = name
+        self.variables = dict(variables)
+        self._colors = {}   # type: Dict[str, QColor]
+
+    def __getitem__(self, name: str) -> str:
+        return self.variables[name]
+
+    def copy(self, name: str, **variables) -> 'Theme':
+        """ return a new theme overriding some of the variables """
+        return Theme(name, {**self.variables, **variables})
+
+    def resolve(self, value: str) -> str:
+        """ resolve a `@name` reference, other values are returned unchanged """
+        if isinstance(value, str) and value.startswith("@"):
+            try:
+                return self.variables[value[1:]]
+            except KeyError:
+                raise KeyError(f"Theme '{self.name}' has no variable: {value}") from None
+        return value
+
+    def color(self, value: str) -> QColor:
+        """ return the cached QColor of a color or a `@name` reference """
+        color = self._colors.get(value)
+        if color is None:
+            color = self._colors[value] = QColor(self.resolve(value))
+        return color
+
+BLENDER_DARK = Theme("BlenderDark", {
+    "text_color": "white",
+    "font_family": "Arial, Helvetica, sans-serif",
+    "widget_color": "#545454",
+    "widget_hover_color": "#656565",
+    "widget_press_color": "#222222",
+    "widget_drag_color": "#000000",
+    "accent_color": "#4772b3",
+    "accent_hover_color": "#628bca",
+    "background_color": "#222222",
+    "panel_color": "#3d3d3d",
+    "field_color": "#1d1d1d",
+    "field_hover_color": "#222222",
+})
+
+_VARIABLE_PATTERN = re.compile(r"@([A-Za-z_][A-Za-z0-9_]*)")
+_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+
+def parseStyleSheet(qss: str) -> List[Tuple[List[str], List[Tuple[str, str]]]]:
+    """ Split qss into rules of (selectors, declarations), dropping comments """
+    rules = []
+    for block in _COMMENT_PATTERN.sub("", qss).split("}"):
+        if "{" not in block:
+            continue
+        selectors, body = block.split("{", 1)
+        selectors = [" ".join(s.split()) for s in selectors.split(",") if s.strip()]
+        if not selectors:
+            continue
+        declarations = []
+        for declaration in body.split(";"):
+            if ":" in declaration:
+                key, value = declaration.split(":", 1)
+                declarations.append((key.strip(), " ".join(value.split())))
+        rules.append((selectors, declarations))
+    return rules
+
+def minifyStyleSheet(qss: str) -> str:
+    """ Strip comments and whitespace, and drop duplicated rules and declarations """
+    seen = set()
+    rules = []
+    for selectors, declarations in parseStyleSheet(qss):
+        body = {}
+        for key, value in declarations:
+            body.pop(key, None)     # the last declaration wins
+            body[key] = value
+        rule = ",".join(selectors) + "{" + ";".join(f"{k}:{v}" for k, v in body.items()) + "}"
+        if rule not in seen:
+            seen.add(rule)
+            rules.append(rule)
+    return "".join(rules)
+
+def substituteVariables(template: str, variables: Mapping[str, str]) -> str:
+    """ Replace every `@name` of the template with its variable """
+    def replace(match):
+        try:
+            return variables[match.group(1)]
+        except KeyError:
+            raise KeyError(f"Undefined qss variable: {match.group(0)}") from None
+    return _VARIABLE_PATTERN.sub(replace, template)
+
+def compileStyleSheet(template: str, variables: Mapping[str, str], cacheDirectory: str = None) -> str:
+    """ Substitute, minify and dedupe a qss template
+
+    When `cacheDirectory` is given the result is stored there, keyed by the
+    hash of the template and the variables, and read back next time.
+    """
+    if not cacheDirectory:
+        return minifyStyleSheet(substituteVariables(template, variables))
+
+    signature = ";".join(f"{key}={value}" for key, value in sorted(variables.items()))
+    key = hashlib.sha1((signature + "\n" + template).encode("utf-8")).hexdigest()
+    cache_path = os.path.join(cacheDirectory, f"{key}.qss")
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            return file.read()
+    except OSError:
+        pass
+
+    qss = minifyStyleSheet(substituteVariables(template, variables))
+    try:
+        os.makedirs(cacheDirectory, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as file:
+            file.write(qss)
+    except OSError:
+        pass
+    return qss
+
+def defaultCacheDirectory() -> str:
+    location = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+    return os.path.join(location, "wblenderstylewidget", "qss") if location else None
+
+class ThemeManager(QObject):
+    """ Holds the current theme and the qss compiled for it """
+
+    themeChanged = pyqtSignal()
+
+    def __init__(self, theme: Theme = BLENDER_DARK, parent=None):
+        super().__init__(parent)
+        self._theme = theme
+        self._compiled = {}     # type: Dict[Tuple[str, Theme], str]
+        self._variables = None
+        self.cacheDirectory = defaultCacheDirectory()
+
+    def theme(self) -> Theme:
+        return self._theme
+
+    def setTheme(self, theme: Theme):
+        """ switch the theme, widgets listening to `themeChanged` restyle themselves """
+        if theme is self._theme:
+            return
+        self._theme = theme
+        self.invalidate()
+        self.themeChanged.emit()
+
+    def resolve(self, value: str) -> str:
+        return self._theme.resolve(value)
+
+    def color(self, value: str) -> QColor:
+        return self._theme.color(value)
+
+    def variables(self) -> Dict[str, str]:
+        """ the variables available to qss, the theme plus the asset locations """
+        if self._variables is None:
+            self._variables = {**resourceVariables(), **self._theme.variables}
+        return self._variables
+
+    def compile(self, template: str) -> str:
+        """ return the template compiled for the current theme, compiling it once """
+        key = (template, self._theme)
+        qss = self._compiled.get(key)
+        if qss is None:
+            qss = compileStyleSheet(template, self.variables(), self.cacheDirectory)
+            self._compiled[key] = qss
+        return qss
+
+    def invalidate(self):
+        """ forget the compiled qss, the disk cache is keyed by content and stays valid """
+        self._compiled.clear()
+        self._variables = None
+
+themeManager = ThemeManager()
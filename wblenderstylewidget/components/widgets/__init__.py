@@ -2,16 +2,19 @@ __all__ = ['PushButton','RadioButton', 'ColorPicker', 'ToggleButton',
            'CheckBox',
            'ProgressBarSlider',  
            'LineEdit', 'SearchLineEdit',
-           'ListWidget',
-           'PlainSpinBox', 'ButtonSpinBox', 'PlainDoubleSpinBox',
-           'RadioButtonGroup', 
-           'SwitchButton']
+           'ListWidget', 'ListView', 'ListModel',
+           'PlainSpinBox', 'ButtonSpinBox', 'PlainDoubleSpinBox', 'VectorSpinBox',
+           'RadioButtonGroup', 'DragGroup',
+           'SwitchButton',
+           'Tooltip', 'tooltipManager']
 
 from .button import PushButton, ColorPicker, ToggleButton, RadioButton
 from .buttongrounp import RadioButtonGroup
 from .checkbox import CheckBox
+from .draggroup import DragGroup
 from .lineedit import LineEdit, SearchLineEdit
-from .listwidget import ListWidget
+from .listwidget import ListWidget, ListView, ListModel
 from .slider import ProgressBarSlider
-from .spinbox import PlainSpinBox, ButtonSpinBox, PlainDoubleSpinBox
-from .switchbutton import SwitchButton
\ No newline at end of file
+from .spinbox import PlainSpinBox, ButtonSpinBox, PlainDoubleSpinBox, VectorSpinBox
+from .switchbutton import SwitchButton
+from .tooltip import Tooltip, tooltipManager
\ No newline at end of file
@@ -1,13 +1,18 @@
 import os
+import weakref
+from contextlib import contextmanager
 from functools import wraps, singledispatchmethod
 from typing import Union, List
 
 from functools import singledispatchmethod
-from PyQt5.QtWidgets import QDialog, QPushButton, QWidget, QButtonGroup
-from PyQt5.QtGui import QIcon, QMouseEvent, QColor
-from PyQt5.QtCore import QSize, Qt
-
-from common.style_sheet import BlenderStyleSheet
+from PyQt5 import sip
+from PyQt5.QtWidgets import QDialog, QPushButton, QWidget, QButtonGroup, QStyle, QStyleOption, QStyleOptionButton
+from PyQt5.QtGui import QIcon, QMouseEvent, QColor, QFont, QFontMetrics, QPainter, QPainterPath
+from PyQt5.QtCore import QRectF, QSize, Qt, QTimer, pyqtSignal
+
+from common.icon import iconRegistry
+from common.style_sheet import BlenderStyleSheet, StyleSheetMode, styleClassRegistry, styleSheetMode
+from common.theme import themeManager
 from .tooltip import Tooltip
 from .widget_base import WidgetBaseSetting
 from ..dialog.color_dialog import ColorDialog
@@ -15,14 +20,104 @@ from ..dialog.color_dialog import ColorDialog
 # __all__ = ["PushButton", "ColorPicker", "RadioButton, ToggleButton"]
 
 def update_Qss(func):
+    """ Request a style update after the setter, bursts of requests are coalesced """
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         result = func(self, *args, **kwargs)
         if self._initialized:
-            self.updateQss()
+            self.requestQssUpdate()
         return result
     return wrapper
 
+class PushButtonStyle(QStyle):
+    """ Paints the button family without style sheets, sharing the geometry between buttons """
+    PADDING = 3
+    SPACING = 4
+
+    def __init__(self):
+        super().__init__()
+        self._paths = {}
+        self._fonts = {}
+
+    def drawControl(self, element: QStyle.ControlElement, option: QStyleOption, painter: QPainter, widget: QWidget = None):
+        if element == QStyle.ControlElement.CE_PushButton and isinstance(option, QStyleOptionButton):
+            self.drawPushButton(option, painter, widget)
+
+    def drawPushButton(self, option: QStyleOptionButton, painter: QPainter, widget: 'PushButton'):
+        theme = themeManager.theme()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # 根據滑鼠動作改變顏色
+        normal, hover, pressed, disabled = widget.stateColors()
+        if not option.state & QStyle.StateFlag.State_Enabled:
+            color = disabled
+        elif option.state & QStyle.StateFlag.State_Sunken:
+            color = pressed
+        elif widget.isHover:
+            color = hover
+        else:
+            color = normal
+        painter.fillPath(self.roundedRectPath(option.rect.width(), option.rect.height(), widget.corner_radius), color)
+
+        font = self.font(theme["font_family"])
+        content_rect = option.rect.adjusted(self.PADDING, 0, -self.PADDING, 0)
+        text_width = QFontMetrics(font).horizontalAdvance(option.text) if option.text else 0
+        icon_width = option.iconSize.width() if not option.icon.isNull() else 0
+        spacing = self.SPACING if text_width and icon_width else 0
+        content_width = min(icon_width + spacing + text_width, content_rect.width())
+
+        if widget.text_align == PushButton.TextAlign.LEFT:
+            x = content_rect.left()
+        elif widget.text_align == PushButton.TextAlign.RIGHT:
+            x = content_rect.right() - content_width
+        else:
+            x = content_rect.left() + (content_rect.width() - content_width) // 2
+
+        if icon_width:
+            pixmap = widget.iconPixmap(option.iconSize)
+            y = option.rect.top() + (option.rect.height() - option.iconSize.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+            x += icon_width + spacing
+
+        if text_width:
+            painter.setFont(font)
+            painter.setPen(theme.color("@text_color"))
+            text_rect = QRectF(x, option.rect.top(), content_rect.right() - x + 1, option.rect.height())
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, option.text)
+
+    def roundedRectPath(self, width: int, height: int, radius: List[int]) -> QPainterPath:
+        """ return the cached path of a rectangle with a radius per corner """
+        key = (width, height, *radius)
+        path = self._paths.get(key)
+        if path is None:
+            if len(self._paths) > 256:
+                self._paths.clear()
+            path = self._paths[key] = self._createRoundedRectPath(QRectF(0, 0, width, height), radius)
+        return path
+
+    def font(self, family: str) -> QFont:
+        font = self._fonts.get(family)
+        if font is None:
+            font = self._fonts[family] = QFont(family.split(",")[0].strip())
+            font.setPixelSize(14)
+        return font
+
+    @staticmethod
+    def _createRoundedRectPath(rect: QRectF, radius: List[int]) -> QPainterPath:
+        left_top, right_top, left_bottom, right_bottom = [min(r, rect.width() / 2, rect.height() / 2) for r in radius]
+        path = QPainterPath()
+        path.moveTo(rect.left() + left_top, rect.top())
+        path.lineTo(rect.right() - right_top, rect.top())
+        path.arcTo(rect.right() - 2 * right_top, rect.top(), 2 * right_top, 2 * right_top, 90, -90)
+        path.lineTo(rect.right(), rect.bottom() - right_bottom)
+        path.arcTo(rect.right() - 2 * right_bottom, rect.bottom() - 2 * right_bottom, 2 * right_bottom, 2 * right_bottom, 0, -90)
+        path.lineTo(rect.left() + left_bottom, rect.bottom())
+        path.arcTo(rect.left(), rect.bottom() - 2 * left_bottom, 2 * left_bottom, 2 * left_bottom, 270, -90)
+        path.lineTo(rect.left(), rect.top() + left_top)
+        path.arcTo(rect.left(), rect.top(), 2 * left_top, 2 * left_top, 180, -90)
+        path.closeSubpath()
+        return path
+
 class PushButton(QPushButton, WidgetBaseSetting):
     """
     A custom QPushButton with additional features such as configurable corner radius,
@@ -66,6 +161,20 @@ class PushButton(QPushButton, WidgetBaseSetting):
         CENTER = Qt.AlignmentFlag.AlignCenter
         RIGHT = Qt.AlignmentFlag.AlignRight
 
+    class RenderMode:
+        STYLE_SHEET = 0
+        PAINTER = 1
+
+    # the render mode of new buttons
+    defaultRenderMode = RenderMode.STYLE_SHEET
+    buttonStyle = None
+    # the buttons in the PAINTER mode, repainted when the theme changes
+    _paintedButtons = weakref.WeakSet()
+    # the buttons carrying their own style sheet, restyled when the theme changes
+    _styledButtons = weakref.WeakSet()
+    # the style sheet of each style key in the current theme, shared by identical buttons
+    _qssCache = {}
+
     class CornerRadiusAlign:
         LEFT_TOP = 1
         TOP = 2
@@ -82,17 +191,26 @@ class PushButton(QPushButton, WidgetBaseSetting):
                  parent: QWidget = None, **kwargs):
         super().__init__(*args, parent=parent, **kwargs)
         self._initialized = False
+        self._qssDirty = False
+        self._qssBatchDepth = 0
+        self._appliedQss = None
+        self._palette = None
+        self._iconPath = None
+        self._renderMode = self.defaultRenderMode
+        self.isPressed = False
+        self.isHover = False
         self.setObjectName('PushButton')
-        self.setColor("#545454", "#656565", "#4772b3")
+        self.setColor("@widget_color", "@widget_hover_color", "@accent_color")
         self.setCornerRadius(self.CornerRadiusAlign.DEFAULT, 5)
         self.setTextAlign(self.TextAlign.CENTER)
 
         self.setIconSize(QSize(12, 12))
-        self.setIcon(QIcon(icon) or None)
+        self.setIcon(icon)
         self.setText(text or None)
         self.setFixedHeight(None)
 
-        self.updateQss()
+        # applied with the configuration made right after construction, or on show
+        self.requestQssUpdate()
         self._initialized = True
         
     @singledispatchmethod
@@ -128,17 +246,54 @@ class PushButton(QPushButton, WidgetBaseSetting):
          : list[str, str, str, str]
         """
         if isinstance(button_radius_type, int) or isinstance(button_radius_type, self.CornerRadiusAlign):
-            left_top = radius if button_radius_type in [0, 1, 2, 4] else 0
-            right_top = radius if button_radius_type in [0, 2, 3, 6] else 0
-            left_bottom = radius if button_radius_type in [0, 4, 7, 8] else 0
-            right_bottom = radius if button_radius_type in [0, 6, 8, 9] else 0
-            self.corner_radius = [left_top, right_top, left_bottom, right_bottom]
+            self.corner_radius = self.cornerRadius(button_radius_type, radius)
         elif isinstance(button_radius_type, list) and len(button_radius_type) == 4:
             self.corner_radius = button_radius_type
         else:
             raise ValueError("corner_radius must be either an integer(or type CornerRadiusAlign) or a list of 4 integers.")
         return self.corner_radius
 
+    @staticmethod
+    def cornerRadius(align: CornerRadiusAlign, radius: int = 5) -> list[int]:
+        """Returns the [left_top, right_top, left_bottom, right_bottom] radii rounding the corners of `align`."""
+        left_top = radius if align in [0, 1, 2, 4] else 0
+        right_top = radius if align in [0, 2, 3, 6] else 0
+        left_bottom = radius if align in [0, 4, 7, 8] else 0
+        right_bottom = radius if align in [0, 6, 8, 9] else 0
+        return [left_top, right_top, left_bottom, right_bottom]
+
+    def setIcon(self, icon: Union[QIcon, str]):
+        """Sets the icon of the button, a path is loaded once through the icon registry."""
+        self._iconPath = icon if isinstance(icon, str) else None
+        super().setIcon(iconRegistry.icon(icon))
+
+    def iconPixmap(self, size: QSize):
+        """Returns the icon rendered at `size` for the current screen."""
+        if self._iconPath is not None:
+            return iconRegistry.pixmap(self._iconPath, size, self.devicePixelRatioF())
+        return self.icon().pixmap(size)
+
+    def renderMode(self):
+        return self._renderMode
+
+    def setRenderMode(self, mode: RenderMode):
+        """
+        Sets how the button is drawn.
+
+        Parameters
+        ----------
+        mode : RenderMode
+            `RenderMode.STYLE_SHEET` styles the button with a generated style sheet,
+            `RenderMode.PAINTER` paints it directly, so hover and press changes only repaint.
+        """
+        if mode == self._renderMode:
+            return
+        self._renderMode = mode
+        if mode == self.RenderMode.PAINTER:
+            styleClassRegistry.remove(self)
+            self._setOwnStyleSheet(None)
+        self.updateQss()
+
     @update_Qss
     def setTextAlign(self, align: TextAlign):
         """
@@ -156,6 +311,9 @@ class PushButton(QPushButton, WidgetBaseSetting):
         """
         Sets the background, hover, and press colors of the button.
 
+        Each color is either a qss color or a `@name` reference to a variable
+        of the current theme, which is resolved again when the theme changes.
+
         Parameters
         ----------
         background_color : str
@@ -184,34 +342,188 @@ class PushButton(QPushButton, WidgetBaseSetting):
         """ Sets the press color of the button."""
         self.pressColor = color
 
-    def updateQss(self):
+    def requestQssUpdate(self):
+        """
+        Schedules a style update.
+
+        Any number of requests made in the same event-loop turn, or inside
+        `batchUpdate`, result in a single call to `updateQss`.
+        """
+        if self._qssDirty:
+            return
+        self._qssDirty = True
+        if not self._qssBatchDepth:
+            QTimer.singleShot(0, self.flushQss)
+
+    def flushQss(self):
+        """Applies a pending style update right away."""
+        if self._qssDirty and not self._qssBatchDepth:
+            self._qssDirty = False
+            self.updateQss()
+
+    @contextmanager
+    def batchUpdate(self):
+        """
+        Groups several setter calls into one style update, applied when the block exits.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with button.batchUpdate():
+                button.setBackgroundColor("#1d1d1d")
+                button.setHoverColor("#222222")
+                button.setPressColor("#1d1d1d")
+        """
+        self._qssBatchDepth += 1
+        try:
+            yield self
+        finally:
+            self._qssBatchDepth -= 1
+            self.flushQss()
+
+    def statePalette(self) -> dict:
+        """
+        Returns the colors of every state, resolved once per color or theme change.
+
+        Returns
+        -------
+        dict
+            Maps the toggled state to the (normal, hover, pressed, disabled) QColors.
+        """
+        theme = themeManager.theme()
+        if self._palette is None or self._palette[0] is not theme:
+            self._palette = (theme, self.createStatePalette())
+        return self._palette[1]
+
+    def createStatePalette(self) -> dict:
+        colors = tuple(themeManager.color(color) for color in
+                       (self.backGroundColor, self.hoverColor, self.pressColor, self.backGroundColor))
+        return {False: colors, True: colors}
+
+    def stateColors(self) -> tuple:
+        """Returns the (normal, hover, pressed, disabled) colors of the current state."""
+        return self.statePalette()[False]
+
+    def styleKey(self) -> tuple:
+        """Returns the values the generated style sheet depends on."""
+        return (self.backGroundColor, self.hoverColor, self.pressColor,
+                tuple(self.corner_radius), int(self.text_align))
+
+    @staticmethod
+    def createStyleSheet(selector: str, background_color: str, hover_color: str, press_color: str,
+                         corner_radius: tuple, text_align: int) -> str:
+        """Generates the style sheet of the buttons matched by `selector`."""
         align_dict = {
-            self.TextAlign.LEFT: 'left',
-            self.TextAlign.CENTER: 'center',
-            self.TextAlign.RIGHT: 'right'
+            int(PushButton.TextAlign.LEFT): 'left',
+            int(PushButton.TextAlign.CENTER): 'center',
+            int(PushButton.TextAlign.RIGHT): 'right'
         }
-        qss = f"""
-            QPushButton#PushButton {{
-                background-color: {self.backGroundColor};
-                border-top-left-radius: {self.corner_radius[0]}px;
-                border-top-right-radius: {self.corner_radius[1]}px;
-                border-bottom-left-radius: {self.corner_radius[2]}px;
-                border-bottom-right-radius: {self.corner_radius[3]}px;
-                color: white;
-                font-family: Arial, Helvetica, sans-serif;
+        theme = themeManager.theme()
+        return f"""
+            {selector} {{
+                background-color: {theme.resolve(background_color)};
+                border-top-left-radius: {corner_radius[0]}px;
+                border-top-right-radius: {corner_radius[1]}px;
+                border-bottom-left-radius: {corner_radius[2]}px;
+                border-bottom-right-radius: {corner_radius[3]}px;
+                color: {theme["text_color"]};
+                font-family: {theme["font_family"]};
                 font-size: 14px;
                 padding-left: 3px;
                 padding-right: 3px;
-                text-align: {align_dict[self.text_align]};
+                text-align: {align_dict[text_align]};
+            }}
+            {selector}:hover {{
+                background-color: {theme.resolve(hover_color)};
             }}
-            QPushButton#PushButton:hover {{
-                background-color: {self.hoverColor};
+            {selector}:pressed {{
+                background-color: {theme.resolve(press_color)};
             }}
-            QPushButton#PushButton:pressed {{
-                background-color: {self.pressColor};
+            {selector}:disabled {{
+                background-color: {theme.resolve(background_color)};
             }}
         """
-        self.setStyleSheet(qss)
+
+    def updateQss(self):
+        self._qssDirty = False
+        self._palette = None
+        if self._renderMode == self.RenderMode.PAINTER:
+            self._paintedButtons.add(self)
+            self.update()
+            return
+
+        self._paintedButtons.discard(self)
+        key = self.styleKey()
+        if styleSheetMode() == StyleSheetMode.APPLICATION:
+            # identical buttons share one class of the application style sheet, restyled with the theme
+            self._setOwnStyleSheet(None)
+            styleClassRegistry.apply(self, key, type(self).styleClassFactory(key))
+            return
+
+        # its own style sheet ranks above those of its ancestors and of the application
+        cacheKey = (type(self), key)
+        qss = PushButton._qssCache.get(cacheKey)
+        if qss is None:
+            qss = PushButton._qssCache[cacheKey] = self.createStyleSheet("QPushButton#PushButton", *key)
+        self._setOwnStyleSheet(qss)
+
+    def _setOwnStyleSheet(self, qss: str):
+        """ set the style sheet of the button, None to clear it, skipping an unchanged one """
+        if qss == self._appliedQss:
+            return
+        self._appliedQss = qss
+        self.setStyleSheet(qss or "")
+        if qss is None:
+            self._styledButtons.discard(self)
+        else:
+            self._styledButtons.add(self)
+
+    @classmethod
+    def styleClassFactory(cls, key: tuple):
+        """Returns the factory of the style sheet shared by the buttons of `key`."""
+        createStyleSheet = cls.createStyleSheet
+        return lambda selector: createStyleSheet(f"QPushButton#PushButton{selector}", *key)
+
+    @staticmethod
+    def repaintPaintedButtons():
+        """Repaints the buttons of the PAINTER mode, e.g. with the colors of a new theme."""
+        for button in list(PushButton._paintedButtons):
+            if not sip.isdeleted(button):
+                button.update()
+
+    @staticmethod
+    def restyleStyledButtons():
+        """Regenerates the style sheets of the buttons carrying their own, e.g. for a new theme."""
+        PushButton._qssCache.clear()
+        for button in list(PushButton._styledButtons):
+            if not sip.isdeleted(button):
+                button.updateQss()
+
+    @staticmethod
+    def styleClassStats() -> dict:
+        """
+        Returns the number of distinct style classes versus button instances.
+
+        Only buttons styled in the application style sheet mode are counted.
+        """
+        return styleClassRegistry.stats(PushButton)
+
+    def showEvent(self, event):
+        self.flushQss()
+        super().showEvent(event)
+
+    def paintEvent(self, event):
+        if self._renderMode != self.RenderMode.PAINTER:
+            super().paintEvent(event)
+            return
+        if PushButton.buttonStyle is None:
+            PushButton.buttonStyle = PushButtonStyle()
+
+        painter = QPainter(self)
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        PushButton.buttonStyle.drawControl(QStyle.ControlElement.CE_PushButton, option, painter, self)
         
     def mousePressEvent(self, event: QMouseEvent):
         self.isPressed = True
@@ -369,22 +681,16 @@ class ToggleButton(PushButton):
         app.exec_()
     """
 
+    # default toggle colors, available while PushButton builds the first style sheet
+    toggleBackgroundColor = "@accent_color"
+    toggleHoverColor = "@accent_hover_color"
+    togglePressColor = "@accent_hover_color"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.toggled = False
-        self._backgraoundColor = self.backGroundColor
-        self._pressColor = self.pressColor
-        self._hoverColor = self.hoverColor
-        self.setToggleColor("#4772b3", "#628bca", "#628bca")
-        self.updateQss()
+        self.setCheckable(True)
 
         self.initialized = True
-    
-    @update_Qss
-    def setChecked(self, a0:bool):
-        self.toggled = a0
-        self.getButtonColor(self.toggled)
-        super().setChecked(a0)
 
     @update_Qss
     def setToggleColor(self, toggle_background_color:str, toggle_hover_color:str, toggle_press_color:str):
@@ -404,21 +710,38 @@ class ToggleButton(PushButton):
     def setToggleHoverColor(self, color:str):
         self.toggleHoverColor = color
 
-    @update_Qss
     def getButtonColor(self, toggled):
-        if toggled:
-            self.backGroundColor = self.toggleBackgroundColor
-            self.pressColor = self.togglePressColor
-            self.hoverColor = self.toggleHoverColor
-        else: 
-            self.backGroundColor = self._backgraoundColor
-            self.pressColor = self._pressColor
-            self.hoverColor = self._hoverColor
+        """
+        Shows the colors of the toggled or untoggled state, checking or unchecking the button.
 
-    def mousePressEvent(self, event: QMouseEvent):
-        self.toggled = not self.toggled
-        self.getButtonColor(self.toggled)
-        super().mousePressEvent(event)
+        Both states are part of the same style sheet, the toggled one selected by the `:checked`
+        pseudo-state, so toggling only repaints the button.
+        """
+        self.setChecked(toggled)
+
+    def createStatePalette(self) -> dict:
+        palette = super().createStatePalette()
+        colors = tuple(themeManager.color(color) for color in
+                       (self.toggleBackgroundColor, self.toggleHoverColor, self.togglePressColor,
+                        self.toggleBackgroundColor))
+        return {False: palette[False], True: colors}
+
+    def stateColors(self) -> tuple:
+        return self.statePalette()[self.isChecked()]
+
+    def styleKey(self) -> tuple:
+        return super().styleKey() + (self.toggleBackgroundColor, self.toggleHoverColor, self.togglePressColor)
+
+    @staticmethod
+    def createStyleSheet(selector: str, background_color: str, hover_color: str, press_color: str,
+                         corner_radius: tuple, text_align: int, toggle_background_color: str = None,
+                         toggle_hover_color: str = None, toggle_press_color: str = None) -> str:
+        """Generates the style sheet of both toggle states, the toggled one under the `:checked` pseudo-state."""
+        off = PushButton.createStyleSheet(selector, background_color, hover_color,
+                                          press_color, corner_radius, text_align)
+        on = PushButton.createStyleSheet(f'{selector}:checked', toggle_background_color,
+                                         toggle_hover_color, toggle_press_color, corner_radius, text_align)
+        return off + on
 
 class RadioButton(ToggleButton):
     """
@@ -455,18 +778,65 @@ class RadioButton(ToggleButton):
         app.exec_()
     """
 
+    selected = pyqtSignal()
+
     def __init__(self, group: QButtonGroup, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.toggled = False
         self.group = group
         self.group.addButton(self)
-        self.updateQss()
+        self.toggled.connect(self._onToggled)
+
+    def setChecked(self, a0: bool):
+        """
+        Checks or unchecks the button.
+
+        An exclusive group refuses to uncheck its checked button, it is lifted
+        for the call so that unchecking leaves the group without a selection.
+        """
+        if not a0 and self.isChecked() and self.group.exclusive():
+            self.group.setExclusive(False)
+            super().setChecked(False)
+            self.group.setExclusive(True)
+        else:
+            super().setChecked(a0)
+
+    def isSelected(self) -> bool:
+        return self.isChecked()
+
+    def setSelected(self, selected: bool = True):
+        """
+        Selects or deselects the button.
+
+        The exclusive group unchecks its previously checked button, so selecting
+        a button only restyles it and that one, whatever the group size.
+        """
+        self.setChecked(selected)
+
+    def _onToggled(self, checked: bool):
+        if checked:
+            self.selected.emit()
 
     def mousePressEvent(self, event: QMouseEvent):
-        if not self.toggled:
-            self.toggled = True
-            self.getButtonColor(self.toggled)
-            for button in self.group.buttons():
-                if button != self:
-                    button.toggled = False
-                    button.getButtonColor(button.toggled)
\ No newline at end of file
+        # selected on press, a press on the selected button keeps it
+        if not self.isChecked():
+            self.setSelected(True)
+
+def registerStockStyleClasses():
+    """ Intern the looks of the stock buttons, so that building them in application mode adds no style class """
+    center = int(PushButton.TextAlign.CENTER)
+    colors = ("@widget_color", "@widget_hover_color", "@accent_color")
+    toggleColors = (ToggleButton.toggleBackgroundColor, ToggleButton.toggleHoverColor, ToggleButton.togglePressColor)
+    # the plain buttons and the ends and middle of a RadioButtonGroup
+    for align in (PushButton.CornerRadiusAlign.DEFAULT, PushButton.CornerRadiusAlign.LEFT,
+                  PushButton.CornerRadiusAlign.CENTER, PushButton.CornerRadiusAlign.RIGHT):
+        key = colors + (tuple(PushButton.cornerRadius(align)), center)
+        styleClassRegistry.intern(key, PushButton.styleClassFactory(key))
+        styleClassRegistry.intern(key + toggleColors, ToggleButton.styleClassFactory(key + toggleColors))
+    # the buttons of a SearchLineEdit
+    for align in (PushButton.CornerRadiusAlign.LEFT, PushButton.CornerRadiusAlign.RIGHT):
+        key = ("@field_color", "@field_hover_color", "@field_color", tuple(PushButton.cornerRadius(align)), center)
+        styleClassRegistry.intern(key, PushButton.styleClassFactory(key))
+
+registerStockStyleClasses()
+themeManager.themeChanged.connect(PushButton.repaintPaintedButtons)
+themeManager.themeChanged.connect(PushButton.restyleStyledButtons)
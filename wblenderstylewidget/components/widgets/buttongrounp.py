@@ -1,4 +1,5 @@
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QButtonGroup
+from PyQt5.QtCore import pyqtSignal
 
 from .button import PushButton, RadioButton
 
@@ -20,6 +21,12 @@ class RadioButtonGroup(QWidget):
 
         The parent widget of the button group. Default is None.
 
+    Signals
+    -------
+    currentChanged(int)
+
+        Emitted once with the new index when the selected button changes.
+
     Examples
     --------
     
@@ -36,9 +43,12 @@ class RadioButtonGroup(QWidget):
         window.show()
         app.exec_()
     """
+    currentChanged = pyqtSignal(int)
+
     def __init__(self, lists: list[str] = [""], initial_selection: int = 0, parent=None):
         super().__init__(parent)
         
+        self._currentIndex = -1
         self.button_group = QButtonGroup(self)
         self.setLayout(self.setup_layout(lists, initial_selection))
 
@@ -51,12 +61,42 @@ class RadioButtonGroup(QWidget):
             radioButton = RadioButton(self.button_group, text=item)
             radioButton.setCornerRadius(self.setRatioButtonCornerRadius(index, len(lists)))
             self.button_group.addButton(radioButton, index)
+            radioButton.toggled.connect(self._onButtonToggled)
             hBoxLayout.addWidget(radioButton)
             if index == initial_selection:
                 radioButton.setChecked(True)
 
         return hBoxLayout
 
+    def currentIndex(self) -> int:
+        """Returns the index of the selected button, or -1 when none is selected."""
+        return self._currentIndex
+
+    def setCurrentIndex(self, index: int):
+        """
+        Selects the button at `index`.
+
+        Only the previously and the newly selected buttons are restyled.
+
+        Parameters
+        ----------
+        index : int
+
+            The index of the button to select.
+        """
+        button = self.button_group.button(index)
+        if button is None:
+            raise IndexError(f"RadioButtonGroup has no button at index {index}")
+        button.setSelected(True)
+
+    def _onButtonToggled(self, checked: bool):
+        # switching buttons unchecks the previous one after the group moved to the new one
+        button = self.button_group.checkedButton()
+        index = self.button_group.id(button) if button is not None else -1
+        if index != self._currentIndex:
+            self._currentIndex = index
+            self.currentChanged.emit(index)
+
     def setRatioButtonCornerRadius(self, index:int, total:int):
         """
         Sets the corner radius for the radio buttons based on their position in the group.
@@ -111,16 +111,14 @@ class SearchLineEdit(QWidget):
         
         self.hBoxLayout = QHBoxLayout()
         self.search_button = PushButton(icon=BlenderStyleIcon.SEARCH)
-        self.search_button.setCornerRadius(PushButton.CornerRadiusAlign.LEFT)
-        self.search_button.setBackgroundColor("#1d1d1d")
-        self.search_button.setHoverColor("#222222")
-        self.search_button.setPressColor("#1d1d1d")
+        with self.search_button.batchUpdate():
+            self.search_button.setCornerRadius(PushButton.CornerRadiusAlign.LEFT)
+            self.search_button.setColor("@field_color", "@field_hover_color", "@field_color")
         self.search_linEdit = LineEdit()
         self.deleted_button = PushButton(icon=BlenderStyleIcon.CLOSE)
-        self.deleted_button.setCornerRadius(PushButton.CornerRadiusAlign.RIGHT)
-        self.deleted_button.setBackgroundColor("#1d1d1d")
-        self.deleted_button.setHoverColor("#222222")
-        self.deleted_button.setPressColor("#1d1d1d")
+        with self.deleted_button.batchUpdate():
+            self.deleted_button.setCornerRadius(PushButton.CornerRadiusAlign.RIGHT)
+            self.deleted_button.setColor("@field_color", "@field_hover_color", "@field_color")
 
         self.initWidget()
         self.initLayout()
@@ -1,44 +1,47 @@
 from typing import Union
-from PyQt5.QtWidgets import QApplication, QProgressBar, QSizePolicy, QStyle, QStyleOption, QStyleOptionProgressBar, QWidget
-from PyQt5.QtGui import QColor, QCursor, QFont, QMouseEvent, QPainter
-from PyQt5.QtCore import QEvent, QPointF, Qt
+from PyQt5.QtWidgets import QApplication, QProgressBar, QStyle, QStyleOption, QStyleOptionProgressBar, QWidget
+from PyQt5.QtGui import QCursor, QMouseEvent, QPainter, QStaticText
+from PyQt5.QtCore import QEvent, QPointF, Qt, pyqtSignal
 
-from common.style_sheet import BlenderStyleSheet
-from .widget_base import WidgetBaseSetting
+from common.frame_clock import frameClock
+from common.theme import themeManager
+from .widget_base import ValueTracking, WidgetBaseSetting
 
 class ProgressBarSliderStyle(QStyle):
     def drawControl(self, element: QStyle.ControlElement, option: QStyleOption, painter: QPainter, widget: QWidget = None, *args,
-                    color:str):
+                    color:str, fraction:float=None):
         self.widget = widget
         if element == QStyle.ControlElement.CE_ProgressBar:
             if isinstance(option, QStyleOptionProgressBar):
-                self.drawProgressBar(option, painter, color)
+                if fraction is None:
+                    fraction = option.progress / 100.0
+                self.drawProgressBar(option, painter, color, fraction)
 
-    def drawProgressBar(self, option: QStyleOptionProgressBar, painter: QPainter, color:str):
+    def drawProgressBar(self, option: QStyleOptionProgressBar, painter: QPainter, color:str, fraction:float):
         background_rect = option.rect
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # 隨滑鼠動作改變顏色
         if self.widget.isEnter and self.widget.isDragging:
-            painter.setBrush(QColor('#000000'))
+            painter.setBrush(themeManager.color("@widget_drag_color"))
         elif self.widget.isEnter and not self.widget.isDragging:
-            painter.setBrush(QColor('#656565'))
+            painter.setBrush(themeManager.color("@widget_hover_color"))
         else:
-            painter.setBrush(QColor('#545454'))
+            painter.setBrush(themeManager.color("@widget_color"))
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(background_rect, 5, 5)
         
         # Draw Progressbar
         progress_rect = background_rect.adjusted(0, 0, 0, 0)
-        progress_width = int(progress_rect.width() * (option.progress / 100.0))
+        progress_width = int(progress_rect.width() * fraction)
         progress_rect.setWidth(progress_width)
 
         # 繪製帶有圓角效果的進度條
-        painter.setBrush(QColor(color))
+        painter.setBrush(themeManager.color(color))
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(progress_rect, 5, 5)
 
-class ProgressBarSlider(QProgressBar, WidgetBaseSetting):
+class ProgressBarSlider(QProgressBar, WidgetBaseSetting, ValueTracking):
     """
     This is a custom QProgressBar that behaves like a QSlider, allowing users to drag and set values.
 
@@ -47,18 +50,21 @@ class ProgressBarSlider(QProgressBar, WidgetBaseSetting):
     text : str, optional
         The text to be displayed on the progress bar. Default is "Value".
 
-    minimum : int, optional
+    minimum : Union[float, int], optional
         The minimum value of the progress bar. Default is 0.
 
-    maximum : int, optional
+    maximum : Union[float, int], optional
         The maximum value of the progress bar. Default is 100.
 
     initial_value : Union[float, int], optional
         The initial value of the progress bar. Can be a float representing a percentage
         (e.g., 0.5 for 50%) or an integer representing an absolute value. Default is 0.5.
 
+    step : float, optional
+        The values are rounded to multiples of `step` from the minimum, 0 for no rounding. Default is 0.
+
     color : str, optional
-        The color of the progress bar. Default is "#4772b3".
+        The color of the progress bar, a qss color or a `@name` theme variable. Default is "@accent_color".
 
     decimal_places : int, optional
         The number of decimal places to display for the progress value. Default is 2.
@@ -69,6 +75,23 @@ class ProgressBarSlider(QProgressBar, WidgetBaseSetting):
     **kwargs : dict
         Additional keyword arguments to pass to the QProgressBar constructor.
 
+    Signals
+    -------
+    floatValueChanged(float)
+        Emitted with the value, a float of the `minimum..maximum` range, when it changes.
+
+    valueChanged(int)
+        The signal of QProgressBar, emitted with the value as a percent of the range when that percent changes.
+
+    editingFinished()
+        Emitted when a drag is released.
+
+    Notes
+    -----
+    The value is a float of the `minimum..maximum` range, carried by `floatValueChanged`.
+    Dragging moves the value by the range over the widget width, holding Shift moves it
+    `PRECISION_FACTOR` times slower for fine adjustment.
+
     Examples
     --------
 
@@ -85,8 +108,19 @@ class ProgressBarSlider(QProgressBar, WidgetBaseSetting):
         app.exec_()
 
     """
-    def __init__(self, text="Value", minimum:int=0, maximum:int=100 , initial_value: Union[float, int]=0.5, parent=None, *args,
-                color:str="#4772b3", decimal_places:int=2, **kwargs):
+    # emitted with the float value, QProgressBar.valueChanged keeps the integer percent
+    floatValueChanged = pyqtSignal(float)
+    # emitted when a drag is released
+    editingFinished = pyqtSignal()
+
+    # shared by every slider, created with the first paint
+    sliderStyle = None
+
+    # decimal places kept in the value
+    VALUE_DIGITS = 10
+
+    def __init__(self, text="Value", minimum:Union[float, int]=0, maximum:Union[float, int]=100 , initial_value: Union[float, int]=0.5, parent=None, *args,
+                color:str="@accent_color", decimal_places:int=2, step:float=0, **kwargs):
         super().__init__(parent)
         self.text = text
         self.minimum = minimum
@@ -94,12 +128,30 @@ class ProgressBarSlider(QProgressBar, WidgetBaseSetting):
         self.color = color
         self.initial_value = initial_value
         self.decimal_places = decimal_places
+        self.step = step
         self.apply_style = False
         self.isEnter = False
         self.isDragging = False
 
+        self._value = float(minimum)
+        self._percent = 0
+        # the displayed value, ahead of value() while a drag is not committed
+        self._sliderPosition = float(minimum)
+        # derived from the displayed value when it changes, so painting converts nothing
+        self._fraction = 0.0
+        self._valueText = None
+        self._labelText = None
+        self._styleOption = QStyleOptionProgressBar()
+        # drag motion not applied yet, in pixels, applied once per frame, and the
+        # dragged position before rounding, so steps smaller than a pixel add up
+        self._dragX = None
+        self._dragDelta = 0.0
+        self._dragPosition = 0.0
+
         self.BaseSetting()
+        self.initValueTracking()
         self.innerSetting()
+        themeManager.themeChanged.connect(self.update)
 
     def innerSetting(self):
         self.setRange(self.minimum, self.maximum)
@@ -107,20 +159,41 @@ class ProgressBarSlider(QProgressBar, WidgetBaseSetting):
 
         self._setInitialValue(self.initial_value)
 
-    def setRange(self, minimum: int, maximum: int):
+    def setRange(self, minimum: Union[float, int], maximum: Union[float, int]):
         """
         This method sets the minimum and maximum values for the progress bar,
         defining the range of values it can represent. 
 
         Parameters
         ----------
-        minimum : int
+        minimum : Union[float, int]
             The minimum value of the progress bar.
-        maximum : int
+        maximum : Union[float, int]
             The maximum value of the progress bar.
         """
+        if minimum > maximum:
+            raise ValueError("Minimum value cannot be greater than maximum value")
+        self.minimum = minimum
+        self.maximum = maximum
         self.min_value = minimum
         self.max_value = maximum
+        self.setValue(self._value)
+
+    def setSingleStep(self, step: float):
+        """Rounds the values to multiples of `step` from the minimum, 0 for no rounding."""
+        self.step = max(0.0, step)
+        self.setValue(self._value)
+
+    def singleStep(self) -> float:
+        return self.step
+
+    def setDecimals(self, decimals: int):
+        """Sets the number of decimal places displayed."""
+        self.decimal_places = decimals
+        self._updateDisplay(self._sliderPosition, force=True)
+
+    def decimals(self) -> int:
+        return self.decimal_places
 
     def setBackgroundColor(self, color:str):
         """Sets the background color of the progress bar."""
@@ -130,9 +203,83 @@ class ProgressBarSlider(QProgressBar, WidgetBaseSetting):
         """Sets the color of the progress indicator of the progress bar."""
         self.progressColor = color
 
-    def getValue(self):
+    def getValue(self) -> float:
         """Returns the current value of the progress bar."""
-        return self.value()
+        return self._value
+
+    def value(self) -> float:
+        return self._value
+
+    def setValue(self, value: Union[float, int]):
+        value = self.boundValue(value)
+        self._updateDisplay(value)
+        if value != self._value:
+            self._value = value
+            self.floatValueChanged.emit(value)
+            span = self.maximum - self.minimum
+            percent = round((value - self.minimum) / span * 100) if span else 0
+            if percent != self._percent:
+                self._percent = percent
+                self.valueChanged.emit(percent)
+
+    def boundValue(self, value: Union[float, int]) -> float:
+        """Returns `value` clamped to the range and rounded to the step, and to `VALUE_DIGITS` decimal places."""
+        value = min(max(float(value), self.minimum), self.maximum)
+        if self.step > 0:
+            value = self.minimum + round((value - self.minimum) / self.step) * self.step
+            value = min(value, self.maximum)
+        # drops the float error of the drag arithmetic, e.g. 74.99999999999999
+        return round(value, self.VALUE_DIGITS)
+
+    def sliderPosition(self) -> float:
+        """Returns the displayed value, which is ahead of `value()` while the drag is not committed."""
+        return self._sliderPosition
+
+    def showDragValue(self, value: float):
+        self._updateDisplay(value)
+
+    def _updateDisplay(self, value: float, force: bool = False):
+        """ derive the paint state of a displayed value, repainting only if it looks different """
+        if value == self._sliderPosition and not force:
+            return
+        self._sliderPosition = value
+        span = self.maximum - self.minimum
+        fraction = (value - self.minimum) / span if span else 0.0
+        text = f"{value:.{self.decimal_places}f}"
+
+        width = self.width() - 2
+        if force or int(width * fraction) != int(width * self._fraction) or \
+                self._valueText is None or self._valueText[0] != text:
+            self.update()
+        self._fraction = fraction
+        if self._valueText is None or self._valueText[0] != text:
+            self._valueText = (text, None, 0.0, 0)
+
+    def valueText(self) -> tuple:
+        """ the displayed value laid out once per text, with its width and height """
+        text, staticText, width, height = self._valueText
+        if staticText is None:
+            staticText = QStaticText(text)
+            staticText.setTextFormat(Qt.TextFormat.PlainText)
+            staticText.prepare(font=self.font())
+            self._valueText = (text, staticText, staticText.size().width(), self.fontMetrics().height())
+        return self._valueText
+
+    def labelText(self) -> tuple:
+        """ the label laid out once for the current text and font, with its ascent """
+        if self._labelText is None or self._labelText[0] != self.text:
+            label = QStaticText(self.text)
+            label.setTextFormat(Qt.TextFormat.PlainText)
+            label.prepare(font=self.font())
+            self._labelText = (self.text, label, self.fontMetrics().ascent())
+        return self._labelText
+
+    def changeEvent(self, event: QEvent):
+        if event.type() == QEvent.Type.FontChange:
+            self._labelText = None
+            if self._valueText is not None:
+                self._valueText = (self._valueText[0], None, 0.0, 0)
+        super().changeEvent(event)
 
     def _setInitialValue(self, initial_value: Union[float, int]):
         '''Set the initial value of the progress bar based on the input.
@@ -141,7 +288,7 @@ class ProgressBarSlider(QProgressBar, WidgetBaseSetting):
         (e.g., 0.5 for 50%) or an integer representing an absolute value.
         '''
         if isinstance(initial_value, float) and 0 <= initial_value <= 1:
-            self.setValue(int(initial_value * 100))
+            self.setValue(self.minimum + initial_value * (self.maximum - self.minimum))
         elif isinstance(initial_value, int) or isinstance(initial_value, float):
             self.setValue(initial_value)
         else: raise TypeError("initial_value must be a float or an integer")
@@ -150,7 +297,12 @@ class ProgressBarSlider(QProgressBar, WidgetBaseSetting):
         if event.buttons() == Qt.MouseButton.LeftButton and self.rect().contains(event.pos()):
             self.isDragging = True
             self.update()
-            self.updateProgress(event)
+            # the click sets the value under the cursor, the drag then moves it relatively
+            self._dragX = event.localPos().x()
+            self._dragDelta = 0.0
+            self._dragPosition = min(max(self.valueAt(self._dragX), self.minimum), self.maximum)
+            self.setDragValue(self.boundValue(self._dragPosition))
+            self.startDrag(event.modifiers())
             QApplication.setOverrideCursor(QCursor(Qt.CursorShape.BlankCursor))
 
     def mouseDoubleClickEvent(self, event: QMouseEvent):
@@ -166,6 +318,7 @@ class ProgressBarSlider(QProgressBar, WidgetBaseSetting):
             self.isDragging = False
             QApplication.restoreOverrideCursor()
             self.update()
+            self.endDrag()
         else:
             super().mouseReleaseEvent(event)
 
@@ -180,37 +333,58 @@ class ProgressBarSlider(QProgressBar, WidgetBaseSetting):
         self.update()
         
     def paintEvent(self, event):
+        if ProgressBarSlider.sliderStyle is None:
+            ProgressBarSlider.sliderStyle = ProgressBarSliderStyle()
+
         painter = QPainter(self)
-        style = ProgressBarSliderStyle()
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        opt = QStyleOptionProgressBar()
-        self.initStyleOption(opt)
+        opt = self._styleOption
         opt.rect = self.rect().adjusted(1, 1, -1, -1)
-        opt.textVisible = self.isTextVisible()
-
-        style.drawControl(QStyle.ControlElement.CE_ProgressBar, opt, painter, self, color=self.color)
+        ProgressBarSlider.sliderStyle.drawControl(QStyle.ControlElement.CE_ProgressBar, opt, painter, self,
+                                                  color=self.color, fraction=self._fraction)
 
         painter.setBackgroundMode(Qt.BGMode.TransparentMode)
-        painter.setPen(QColor(Qt.GlobalColor.white))
-        painter.drawText(QPointF(10, self.height() / 2 + 5), self.text)
+        painter.setPen(themeManager.color("@text_color"))
+        _, label, ascent = self.labelText()
+        painter.drawStaticText(QPointF(10, self.height() / 2 + 5 - ascent), label)
 
         # 繪製數值
-        progress = self.value() * (self.maximum - self.minimum) / 100 + self.minimum
-        text = f"{progress:.{self.decimal_places}f}"
-        text_rect = painter.boundingRect(self.rect(), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, text)
-        text_rect.adjust(-5, 0, -5, 0)
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, text)
+        _, value, width, height = self.valueText()
+        painter.drawStaticText(QPointF(self.width() - width - 5, (self.height() - height) / 2), value)
 
-    def updateProgress(self, event):
-        mouse_x = event.x()
-        total_width = self.width()
+    def valueAt(self, x: float) -> float:
+        """Returns the value under the position `x` of the widget."""
+        return self.minimum + x / max(1, self.width()) * (self.maximum - self.minimum)
 
-        progress_percent = mouse_x / total_width
-        if progress_percent < 0:
-            self.setValue(0)
-            return
-        if progress_percent > 1:
-            self.setValue(100)
+    def updateProgress(self, event):
+        """ accumulate the drag motion, applied by `applyDrag` on the next frame """
+        mouse_x = event.localPos().x()
+        speed = self.dragSpeed(event.modifiers())
+        motion = (mouse_x - self._dragX) * speed
+        self._dragX = mouse_x
+        self.dragBy(motion)
+
+    def beginDrag(self):
+        self._dragDelta = 0.0
+        self._dragPosition = self._sliderPosition
+
+    def addDragMotion(self, motion: float):
+        self._dragDelta += motion
+
+    def dragValue(self) -> float:
+        return self._sliderPosition
+
+    def flushDrag(self):
+        """ apply the pending drag motion now, e.g. when the drag ends """
+        if frameClock.isFramePending(self.applyDrag):
+            frameClock.cancelFrame(self.applyDrag)
+            self.applyDrag()
+
+    def applyDrag(self):
+        if not self._dragDelta:
             return
-        self.setValue(int(progress_percent * 100))
\ No newline at end of file
+        delta, self._dragDelta = self._dragDelta, 0.0
+        position = self._dragPosition + delta / max(1, self.width()) * (self.maximum - self.minimum)
+        self._dragPosition = min(max(position, self.minimum), self.maximum)
+        self.setDragValue(self.boundValue(self._dragPosition))
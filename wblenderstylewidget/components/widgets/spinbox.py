@@ -1,13 +1,15 @@
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Union
-from PyQt5.QtWidgets import QApplication, QStyleOptionSpinBox, QStyle, QStyleOption, QWidget, QSpinBox, QHBoxLayout, QDoubleSpinBox, QAbstractSpinBox
-from PyQt5.QtGui import QCursor, QMouseEvent, QPainter, QColor
-from PyQt5.QtCore import Qt, QEvent, QPointF
+from typing import Sequence, Union
+from PyQt5.QtWidgets import QApplication, QStyleOptionSpinBox, QStyle, QStyleOption, QWidget, QSpinBox, QDoubleSpinBox, QAbstractSpinBox, QLineEdit
+from PyQt5.QtGui import QCursor, QMouseEvent, QPainter, QColor, QStaticText
+from PyQt5.QtCore import Qt, QEvent, QPointF, QRect, pyqtSignal
 
-from common.icon import BlenderStyleIcon
+from common.frame_clock import frameClock
+from common.icon import BlenderStyleIcon, iconRegistry
 from common.style_sheet import BlenderStyleSheet
-from .button import PushButton
-from .widget_base import WidgetBaseSetting
+from common.theme import themeManager
+from .button import PushButton, PushButtonStyle
+from .widget_base import ValueTracking, WidgetBaseSetting
 
 class SpinBoxStyle(QStyle):
     def __init__(self):
@@ -25,23 +27,29 @@ class SpinBoxStyle(QStyle):
 
         # 根據滑鼠動作改變顏色
         if self.widget.isEnter and self.widget.isDragging:
-            painter.setBrush(QColor('#222222'))
+            painter.setBrush(themeManager.color("@widget_press_color"))
         elif self.widget.isEnter and not self.widget.isDragging:
-            painter.setBrush(QColor('#656565'))
+            painter.setBrush(themeManager.color("@widget_hover_color"))
         else:
-            painter.setBrush(QColor('#545454'))
+            painter.setBrush(themeManager.color("@widget_color"))
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(background_rect, self.cornerRadius[0], self.cornerRadius[1])
+        # the style is shared by every spin box, the radius belongs to the widget
+        cornerRadius = getattr(self.widget, "cornerRadius", self.cornerRadius)
+        painter.drawRoundedRect(background_rect, cornerRadius[0], cornerRadius[1])
 
     def setRoundRect(self, xRadius:float=5, yRadius:float=5):
         self.cornerRadius[0] = xRadius
         self.cornerRadius[1] = yRadius
 
-class BaseSpinBox(WidgetBaseSetting):
+class BaseSpinBox(WidgetBaseSetting, ValueTracking):
+    # shared by every spin box, created with the first paint
+    spinBoxStyle = None
+
     def __init__(self, text:str=None, parent=None, *args,
                 minimum:Union[int, float]=-1000000, 
                 maximum:Union[int, float]=1000000, **kwargs):
-        super().__init__(parent)
+        # the Qt spin box is initialized by the concrete class, initializing the
+        # widget again here would create and leak a second C++ spin box
         self.minimum = minimum
         self.maximum = maximum
         self.value = 0
@@ -53,7 +61,15 @@ class BaseSpinBox(WidgetBaseSetting):
         self.isLineEditActive = False
         self.cornerRadius = [5, 5]
 
+        # text laid out once, the value text again only when the value changes
+        self._styleOption = QStyleOptionSpinBox()
+        self._labelText = None
+        self._valueText = None
+        # drag motion not applied yet, in value units, applied once per frame
+        self._dragDelta = 0.0
+
         self.BaseSetting()
+        self.initValueTracking()
         self.innerSetting()
         self.installEventFilter(self)
         BlenderStyleSheet.SPINBOX.apply(self)
@@ -62,12 +78,29 @@ class BaseSpinBox(WidgetBaseSetting):
         self.setRange(self.minimum, self.maximum)
         self.setButtonSymbols(QAbstractSpinBox.NoButtons)
         
-        self.line_edit = self.lineEdit()
-        self.line_edit.installEventFilter(self)
-        self.line_edit.setVisible(False)
-        self.line_edit.setDisabled(True)
-        self.setAlignment(Qt.AlignmentFlag.AlignVCenter)
-        self.line_edit.setGeometry(self.rect())
+        # QAbstractSpinBox builds its editor with every spin box, only its configuration
+        # is deferred: it is hidden here and set up by `openLineEdit` on the first edit
+        self._lineEditReady = False
+        editor = self.lineEdit()
+        editor.setVisible(False)
+        editor.setDisabled(True)
+
+    @property
+    def line_edit(self):
+        return self.lineEdit()
+
+    def openLineEdit(self):
+        """ show the editor to type a value, completing its deferred configuration on the first edit """
+        editor = self.lineEdit()
+        if not self._lineEditReady:
+            self._lineEditReady = True
+            self.setAlignment(Qt.AlignmentFlag.AlignVCenter)
+        editor.setGeometry(self.contentRect())
+        # the click did not become a drag, later motion must not start one
+        self.isDragging = False
+        self.isLineEditActive = True
+        editor.setVisible(True)
+        editor.setDisabled(False)
 
     def setRange(self, minimum: Union[int, float], maximum: Union[int, float]):
         '''Override the setRange method to add custom behavior.'''
@@ -92,7 +125,47 @@ class BaseSpinBox(WidgetBaseSetting):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.line_edit.setGeometry(self.rect())
+        if self.isLineEditActive:
+            self.lineEdit().setGeometry(self.contentRect())
+
+    def changeEvent(self, event: QEvent):
+        if event.type() == QEvent.Type.FontChange:
+            self._labelText = None
+            self._valueText = None
+        super().changeEvent(event)
+
+    def labelText(self) -> tuple:
+        """ the label laid out once for the current text and font, with its ascent """
+        if self._labelText is None or self._labelText[0] != self.text:
+            label = QStaticText(self.text)
+            label.setTextFormat(Qt.TextFormat.PlainText)
+            label.prepare(font=self.font())
+            self._labelText = (self.text, label, self.fontMetrics().ascent())
+        return self._labelText
+
+    def valueText(self) -> tuple:
+        """ the value formatted and laid out once per value, with its width and height """
+        value = self.value
+        # 1 and 1.0 are equal but are not displayed alike
+        key = (type(value), value)
+        if self._valueText is None or self._valueText[0] != key:
+            text = QStaticText(self.formatValue(value))
+            text.setTextFormat(Qt.TextFormat.PlainText)
+            text.prepare(font=self.font())
+            self._valueText = (key, text, text.size().width(), self.fontMetrics().height())
+        return self._valueText
+
+    def formatValue(self, value: Union[int, float]) -> str:
+        """ the text displayed for `value` """
+        return f"{value}"
+
+    def valueResolution(self) -> Union[int, float]:
+        """ the smallest change of the value, drags move by whole multiples of it """
+        return 1
+
+    def roundValue(self, value: Union[int, float]) -> Union[int, float]:
+        """ `value` rounded to the resolution """
+        return value
 
     def _setInitialValue(self, initial_value: Union[int, float]):
         '''Set the initial value of the progress bar based on the input.
@@ -109,7 +182,8 @@ class BaseSpinBox(WidgetBaseSetting):
         if event.buttons() == Qt.MouseButton.LeftButton and self.rect().contains(event.pos()):
             self.isDragging = True
             self.isEditing = True
-            self.last_mouse_x = event.x()
+            self.last_mouse_x = event.localPos().x()
+            self._dragDelta = 0.0
             self.update()
             self.updateValue(event)
             QApplication.setOverrideCursor(QCursor(Qt.CursorShape.SizeHorCursor))
@@ -117,7 +191,10 @@ class BaseSpinBox(WidgetBaseSetting):
     def mouseMoveEvent(self, event: QMouseEvent):
         '''滑鼠移動時，如果正在拖動，更新進度'''
         if hasattr(self, 'isDragging') and self.isDragging:
-            self.isEditing = False
+            if self.isEditing:
+                # a click opens the editor, the drag starts with the first motion
+                self.isEditing = False
+                self.startDrag(event.modifiers())
             self.updateValue(event)
         super().mouseMoveEvent(event)
 
@@ -125,15 +202,13 @@ class BaseSpinBox(WidgetBaseSetting):
         '''釋放滑鼠後，停止拖動'''
         if hasattr(self, 'isEditing') and self.isEditing:
             QApplication.restoreOverrideCursor()
-            self.isLineEditActive = True
-            self.line_edit.setVisible(True)
-            self.line_edit.setDisabled(False)
-            
+            self.openLineEdit()
             self.update()
         elif hasattr(self, 'isDragging') and self.isDragging:
             self.isDragging = False
             QApplication.restoreOverrideCursor()
             self.update()
+            self.endDrag()
         else:
             super().mouseReleaseEvent(event)
 
@@ -155,21 +230,22 @@ class BaseSpinBox(WidgetBaseSetting):
         return super().eventFilter(obj, event)
 
     def closeLineEdit(self):
-        self.line_edit = self.lineEdit()
         try:
             if '.' in self.line_edit.text():
                 self.value = float(self.line_edit.text())
             else:
                 self.value = int(self.line_edit.text())
-        except ValueError as e:
-            print("Invalid input:", self.line_edit.text())
+        except ValueError:
+            # an invalid text keeps the last valid value
+            pass
+        self.setDragValue(self.value)
         self.line_edit.setVisible(False)
         self.line_edit.setDisabled(True)
-        self.line_edit.hide()
         self.isDragging = False     # HACK:保持輸入數值後滑鼠處於懸浮狀態
         self.isEditing = False
         self.isLineEditActive = False
         self.setFocus()
+        self.finishEditing()
 
     def checkRange(self, value:int, min:int, max:int):
         return min <= value <= max
@@ -177,43 +253,80 @@ class BaseSpinBox(WidgetBaseSetting):
     def paintEvent(self, event):
         if self.isLineEditActive:
             return
+        if BaseSpinBox.spinBoxStyle is None:
+            BaseSpinBox.spinBoxStyle = SpinBoxStyle()
+
         painter = QPainter(self)
-        style = SpinBoxStyle()  # 使用您定義的SpinBoxStyle
-        style.setRoundRect(self.cornerRadius[0], self.cornerRadius[1])
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.drawBackground(painter)
+        self.drawText(painter, self.contentRect())
 
-        opt = QStyleOptionSpinBox()
-        self.initStyleOption(opt)
-        opt.rect = self.rect().adjusted(0, 0, 0 ,0)
-        style.drawControl(opt, painter, self)
+    def contentRect(self) -> QRect:
+        """ the area of the label, the value and the editor """
+        return self.rect()
 
-        painter.setBackgroundMode(Qt.BGMode.TransparentMode)
-        painter.setPen(QColor(Qt.GlobalColor.white))
+    def drawBackground(self, painter: QPainter):
+        opt = self._styleOption
+        opt.rect = self.rect()
+        BaseSpinBox.spinBoxStyle.drawControl(opt, painter, self)
 
-        value = f"{self.value}"
+    def drawText(self, painter: QPainter, rect: QRect):
+        painter.setBackgroundMode(Qt.BGMode.TransparentMode)
+        painter.setPen(themeManager.color("@text_color"))
 
+        _, value, width, height = self.valueText()
+        top = rect.y() + (rect.height() - height) / 2
         if self.text is not None: 
-            painter.drawText(QPointF(10, self.height() / 2 + 5), self.text)
-            text_rect = painter.boundingRect(self.rect(), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, value)
-            text_rect.adjust(-10, 0, -10, 0)
-            painter.drawText(text_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, value)
+            _, label, ascent = self.labelText()
+            painter.drawStaticText(QPointF(rect.x() + 10, rect.y() + rect.height() / 2 + 5 - ascent), label)
+            painter.drawStaticText(QPointF(rect.x() + rect.width() - width - 10, top), value)
         else:
-            text_rect = painter.boundingRect(self.rect(), Qt.AlignmentFlag.AlignCenter, value)
-            text_rect.adjust(-5, 0, -5, 0)
-            painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, value)
+            painter.drawStaticText(QPointF(rect.x() + (rect.width() - width) / 2 - 5, top), value)
 
     def updateValue(self, event):
-        mouse_x = event.x()
-        speed = 2 if QApplication.keyboardModifiers() & Qt.KeyboardModifier.ControlModifier else 1
-        # 計算實際進度值
-        self.value += int((mouse_x - self.last_mouse_x) / speed)
-        self.last_mouse_x = event.x()
+        """ accumulate the drag motion, applied by `applyDrag` on the next frame """
+        mouse_x = event.localPos().x()
+        speed = self.dragSpeed(event.modifiers())
+        motion = (mouse_x - self.last_mouse_x) * speed
+        self.last_mouse_x = mouse_x
+        self.dragBy(motion)
+
+    def beginDrag(self):
+        self._dragDelta = 0.0
+
+    def addDragMotion(self, motion: float):
+        # 計算實際進度值, in value units, one single step per pixel
+        self._dragDelta += motion * self.singleStep()
+
+    def dragValue(self) -> Union[int, float]:
+        """ the displayed value, ahead of the committed one while dragging """
+        return self.value
+
+    def flushDrag(self):
+        """ apply the pending drag motion now, e.g. when the drag ends """
+        if frameClock.isFramePending(self.applyDrag):
+            frameClock.cancelFrame(self.applyDrag)
+            self.applyDrag()
+
+    def applyDrag(self):
+        """ apply the accumulated drag motion in whole resolution steps, keeping the remainder """
+        resolution = self.valueResolution()
+        # rounded so that float error in the accumulated motion does not drop a step
+        steps = int(round(self._dragDelta / resolution, 9))
+        if steps == 0:
+            return
+        self._dragDelta -= steps * resolution
+        self.value = self.roundValue(self.value + steps * resolution)
         if self.value < self.minimum:
             self.value = self.minimum
         if self.value > self.maximum: 
             self.value = self.maximum
         # 設置SpinBox的值
-        self.setValue(self.value) if isinstance(self.value, int) else float(self.value)
+        self.setDragValue(self.value)
+
+    def showDragValue(self, value: Union[int, float]):
+        self.value = value
+        self.update()
 
 class PlainSpinBox(QSpinBox, BaseSpinBox):
     """
@@ -259,20 +372,54 @@ class PlainSpinBox(QSpinBox, BaseSpinBox):
             self.update()
 
     def setValue(self, value: int):
-        super().setValue(value)
+        value = min(max(value, self.minimum), self.maximum)
+        self.value = value
         QSpinBox.setValue(self, value)
+        self.update()
 
 class PlainDoubleSpinBox(QDoubleSpinBox, BaseSpinBox):
-    '''！！！Still not done yet！！！'''
-    # FIXME 無法即時更新數值
+    """
+    A custom SpinBox for float values, with the same features as PlainSpinBox.
+
+    Dragging changes the value by one single step per pixel, one hundredth by default
+    with 2 decimal places, and holding Shift ten times slower. Values are rounded to
+    the decimal places.
+
+    Parameters:
+    -----------
+    >>> text : str, optional
+
+        The text to be displayed on the SpinBox. Default is None.
+
+    >>> parent : QWidget, optional
+
+        The parent widget of the SpinBox. Default is None.
+
+    >>> decimal_places : int, optional
+
+        The number of decimal places of the value. Default is 2.
+
+    >>> step : float, optional
+
+        The change of the value per dragged pixel. Default is one unit of the last decimal place.
+
+    >>> **kwargs : dict
+
+        Additional keyword arguments to pass to the QAbstractSpinBox constructor.
+
+    Usage:
+    ------
+    >>> spin_box = PlainDoubleSpinBox(text="Scale", decimal_places=3, parent=some_parent_widget)
+    """
+
     def __init__(self, text: str = None, parent=None, *args,
-                 minimum:int=-1000000, 
-                 maximum:int=1000000,
-                 decimal_places:int=2, **kwargs):
+                 minimum:float=-1000000, 
+                 maximum:float=1000000,
+                 decimal_places:int=2, step:float=None, **kwargs):
         QDoubleSpinBox.__init__(self, parent)
-        BaseSpinBox.__init__(self, text, parent, *args, minimum, maximum, **kwargs)
-        self.setRange(-100.0, 100.0)
+        BaseSpinBox.__init__(self, text, parent, *args, minimum=minimum, maximum=maximum, **kwargs)
         self.setDecimals(decimal_places)
+        self.setSingleStep(step if step is not None else 10 ** -decimal_places)
         
     def setRange(self, minimum: float, maximum: float):
         '''Override the setRange method to add custom behavior.'''
@@ -294,11 +441,31 @@ class PlainDoubleSpinBox(QDoubleSpinBox, BaseSpinBox):
         super().setRange(minimum, maximum)
 
     def setValue(self, value: float):
+        value = self.roundValue(min(max(value, self.minimum), self.maximum))
+        self.value = value
         super().setValue(value)
+        self.update()
+
+    def setDecimals(self, decimals: int):
+        super().setDecimals(decimals)
+        self.value = self.roundValue(self.value)
+        self._valueText = None
+        self.update()
+
+    def formatValue(self, value: float) -> str:
+        return f"{value:.{self.decimals()}f}"
 
-class ButtonSpinBox(QWidget):
+    def valueResolution(self) -> float:
+        return 10 ** -self.decimals()
+
+    def roundValue(self, value: float) -> float:
+        return round(float(value), self.decimals())
+
+class ButtonSpinBox(PlainSpinBox):
     """
-    A custom widget combining a spin box with up and down buttons.
+    A custom spin box with arrows to decrease and increase the value by a step.
+
+    The arrows are painted and hit-tested by the spin box itself, a single widget.
 
     Parameters:
     -----------
@@ -320,73 +487,475 @@ class ButtonSpinBox(QWidget):
 
     >>> **kwargs : dict
 
-        Additional keyword arguments to pass to the PlainSpinBox constructor.
+        Additional keyword arguments to pass to the PlainSpinBox constructor, e.g. minimum and maximum.
 
     Usage:
     ------
     >>> button_spin_box = ButtonSpinBox(value=5, step=2, parent=some_parent_widget)
     """
+    class Zone:
+        DOWN = -1
+        UP = 1
+
+    ICON_SIZE = 12
+
     def __init__(self, text: str = None, value:int=1, step:int=1, parent=None, **kwargs):
-        super().__init__(parent)
-        self.value = value
         self.step = step
+        self._hoverZone = None
+        self._pressedZone = None
+        super().__init__(text=text, parent=parent, **kwargs)
+        self.setMouseTracking(True)
+        self.setValue(value)
 
-        self.hBoxLayout = QHBoxLayout()
-        self.downButton = PushButton(icon=BlenderStyleIcon.LEFTARROWHEAD)
-        self.downButton.setCornerRadius(PushButton.CornerRadiusAlign.LEFT)
-        self.downButton.setPressColor("#222222")
-        self.spinBox = PlainSpinBox(text=text, value=self.value, **kwargs)
-        self.upButton = PushButton(icon=BlenderStyleIcon.RIGHTARROWHEAD)
-        self.upButton.setCornerRadius(PushButton.CornerRadiusAlign.RIGHT)
-        self.upButton.setPressColor("#222222")
-
-        self.minimum = self.spinBox.minimum
-        self.maximum = self.spinBox.maximum
-
-        self.initWidget()
-        self.initLayout()
-        self.innerButtonSetting()
-
-    def initWidget(self):
-        self.hBoxLayout.setContentsMargins(0, 0, 0, 0)
-        self.hBoxLayout.setSpacing(0)
-        self.downButton.setFixedWidth(self.downButton.height())
-        self.upButton.setFixedWidth(self.upButton.height())
-        self.spinBox.setFixedHeight(self.downButton.height())
-        self.spinBox.cornerRadius = [0, 0]
-        self.spinBox.setValue(self.spinBox.value)
-
-    def initLayout(self):
-        self.hBoxLayout.addWidget(self.downButton)
-        self.hBoxLayout.addWidget(self.spinBox, stretch=1)
-        self.hBoxLayout.addWidget(self.upButton)
-        self.setLayout(self.hBoxLayout)
-
-    def innerButtonSetting(self):
-        self.downButton.clicked.connect(lambda: self._decreaseValue())
-        self.upButton.clicked.connect(lambda: self._increaseValue())
+    @property
+    def spinBox(self) -> 'ButtonSpinBox':
+        """The spin box itself, the arrows are no longer separate widgets."""
+        return self
 
     def setRange(self, minimum: int, maximum: int) -> None:
         '''設置進度條範圍'''
-        # super().setRange(minimum, maximum)
-        self.spinBox.setRange(minimum, maximum)
+        super().setRange(minimum, maximum)
+
+    def arrowWidth(self) -> int:
+        return self.height()
+
+    def zoneAt(self, x: float) -> int:
+        """Returns the arrow under `x`, or None over the value."""
+        if x < self.arrowWidth():
+            return self.Zone.DOWN
+        if x >= self.width() - self.arrowWidth():
+            return self.Zone.UP
+        return None
+
+    def contentRect(self) -> QRect:
+        return self.rect().adjusted(self.arrowWidth(), 0, -self.arrowWidth(), 0)
+
+    def _setHoverZone(self, zone):
+        if zone != self._hoverZone:
+            self._hoverZone = zone
+            self.update()
+
+    # the handlers of BaseSpinBox come after those of QSpinBox in the MRO, so they are called explicitly
+    def mousePressEvent(self, event: QMouseEvent):
+        zone = self.zoneAt(event.x())
+        if zone is not None and event.button() == Qt.MouseButton.LeftButton:
+            self._pressedZone = zone
+            self.update()
+            return
+        BaseSpinBox.mousePressEvent(self, event)
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        if self._pressedZone is None and not self.isDragging:
+            zone = self.zoneAt(event.x())
+            self.isEnter = zone is None
+            self._setHoverZone(zone)
+        # with mouse tracking, moves without a button only hover
+        if event.buttons() & Qt.MouseButton.LeftButton:
+            BaseSpinBox.mouseMoveEvent(self, event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        if self._pressedZone is not None:
+            # like a button, the arrow acts when released over it
+            zone, self._pressedZone = self._pressedZone, None
+            if self.rect().contains(event.pos()) and self.zoneAt(event.x()) == zone:
+                self._decreaseValue() if zone == self.Zone.DOWN else self._increaseValue()
+            self.update()
+            return
+        BaseSpinBox.mouseReleaseEvent(self, event)
+
+    def enterEvent(self, event: QEvent) -> None:
+        BaseSpinBox.enterEvent(self, event)
+        zone = self.zoneAt(self.mapFromGlobal(QCursor.pos()).x())
+        self.isEnter = zone is None
+        self._setHoverZone(zone)
+
+    def leaveEvent(self, event: QEvent) -> None:
+        BaseSpinBox.leaveEvent(self, event)
+        self._setHoverZone(None)
+
+    def drawBackground(self, painter: QPainter):
+        if PushButton.buttonStyle is None:
+            PushButton.buttonStyle = PushButtonStyle()
+        size = self.arrowWidth()
+
+        # 根據滑鼠動作改變顏色
+        if self.isEnter and self.isDragging:
+            color = "@widget_press_color"
+        elif self.isEnter and self._hoverZone is None:
+            color = "@widget_hover_color"
+        else:
+            color = "@widget_color"
+        painter.fillRect(self.contentRect(), themeManager.color(color))
+
+        for zone, x, radius, icon in ((self.Zone.DOWN, 0, [5, 0, 5, 0], BlenderStyleIcon.LEFTARROWHEAD),
+                                      (self.Zone.UP, self.width() - size, [0, 5, 0, 5], BlenderStyleIcon.RIGHTARROWHEAD)):
+            if self._pressedZone == zone:
+                color = "@widget_press_color"
+            elif self._hoverZone == zone and self._pressedZone is None:
+                color = "@widget_hover_color"
+            else:
+                color = "@widget_color"
+            painter.translate(x, 0)
+            painter.fillPath(PushButton.buttonStyle.roundedRectPath(size, self.height(), radius), themeManager.color(color))
+            painter.translate(-x, 0)
+
+            offset = (size - self.ICON_SIZE) // 2
+            pixmap = iconRegistry.pixmap(icon, self.ICON_SIZE, self.devicePixelRatioF())
+            painter.drawPixmap(x + offset, (self.height() - self.ICON_SIZE) // 2, pixmap)
 
     def _decreaseValue(self):
-        if not self.spinBox.checkRange(self.spinBox.value, self.spinBox.minimum, self.spinBox.maximum):
-            self.spinBox.value = self.spinBox.minimum
-            self.spinBox.update()
-        elif self.spinBox.value > self.spinBox.minimum:
-            current_value = self.spinBox.value
-            new_value = current_value - self.step
-            self.spinBox.value = new_value
-            self.spinBox.update()
+        if not self.checkRange(self.value, self.minimum, self.maximum):
+            self.setValue(self.minimum)
+        elif self.value > self.minimum:
+            self.setValue(self.value - self.step)
 
     def _increaseValue(self):
-        if not self.spinBox.checkRange(self.spinBox.value, self.spinBox.minimum, self.spinBox.maximum):
-            self.spinBox.value = self.spinBox.maximum
-            self.spinBox.update()
-        elif self.spinBox.value < self.spinBox.maximum:
-            current_value = self.spinBox.value
-            new_value = current_value + self.step
-            self.spinBox.value = new_value
-        self.spinBox.update()
\ No newline at end of file
+        if not self.checkRange(self.value, self.minimum, self.maximum):
+            self.setValue(self.maximum)
+        elif self.value < self.maximum:
+            self.setValue(self.value + self.step)
+
+class VectorSpinBox(WidgetBaseSetting, ValueTracking):
+    """
+    A spin box editing the components of a vector, e.g. a location or a color, painted as one widget.
+
+    Each component is dragged or typed like a PlainDoubleSpinBox. Dragging while holding Ctrl
+    edits every component at once. The value is read and written as one tuple, and an edit
+    emits a single `valueChanged`, whatever the number of components it changed.
+
+    In a `DragGroup`, the VectorSpinBox drags every component with the group.
+
+    Parameters:
+    -----------
+    >>> labels : Sequence[str], optional
+
+        The labels of the components, which also give their number. Default is ("X", "Y", "Z").
+
+    >>> value : Sequence[float], optional
+
+        The initial value. Default is 0 for every component.
+
+    >>> orientation : Qt.Orientation, optional
+
+        Stacks the components vertically, as Blender does, or lays them out horizontally. Default is Qt.Vertical.
+
+    >>> decimal_places : int, optional
+
+        The number of decimal places of the components. Default is 2.
+
+    >>> step : float, optional
+
+        The change of a component per dragged pixel. Default is one unit of the last decimal place.
+
+    >>> parent : QWidget, optional
+
+        The parent widget of the VectorSpinBox. Default is None.
+
+    Usage:
+    ------
+    >>> location = VectorSpinBox(("X", "Y", "Z"), value=(0, 1.5, 0), parent=some_parent_widget)
+    >>> location.valueChanged.connect(lambda value: print(value))
+    """
+
+    valueChanged = pyqtSignal(tuple)
+    editingFinished = pyqtSignal()
+
+    # the modifier dragging every component
+    MULTI_EDIT_MODIFIER = Qt.KeyboardModifier.ControlModifier
+    ROW_HEIGHT = 30
+    SPACING = 1
+
+    def __init__(self, labels: Sequence[str] = ("X", "Y", "Z"), value: Sequence[float] = None, parent=None, *args,
+                 minimum: float = -1000000, maximum: float = 1000000, orientation: Qt.Orientation = Qt.Orientation.Vertical,
+                 decimal_places: int = 2, step: float = None, **kwargs):
+        super().__init__(parent)
+        self.labels = tuple(labels)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.orientation = orientation
+        self.decimal_places = decimal_places
+        self.step = step if step is not None else 10 ** -decimal_places
+
+        self._value = tuple(0.0 for _ in self.labels)
+        # the displayed components, ahead of value() while a drag is not committed
+        self._values = list(self._value)
+        self._valueTexts = [None] * len(self.labels)
+        self._labelTexts = [None] * len(self.labels)
+        self._editor = None
+        self._editIndex = None
+
+        self.isEnter = False
+        self.isDragging = False
+        self._hoverIndex = None
+        self._dragIndices = ()
+        self._dragDelta = 0.0
+        self._moved = False
+        self.last_mouse_x = 0.0
+
+        self.BaseSetting()
+        self.initValueTracking()
+        if orientation == Qt.Orientation.Vertical:
+            self.setFixedHeight(len(self.labels) * self.ROW_HEIGHT + (len(self.labels) - 1) * self.SPACING)
+        self.setMouseTracking(True)
+        self.setValue(value if value is not None else self._value)
+        themeManager.themeChanged.connect(self.update)
+
+    def value(self) -> tuple:
+        return self._value
+
+    def setValue(self, value: Sequence[float]):
+        """Sets every component, emitting `valueChanged` once if any of them changed."""
+        if len(value) != len(self.labels):
+            raise ValueError(f"Expected {len(self.labels)} components, got {len(value)}")
+        value = tuple(self.boundValue(component) for component in value)
+        self.showDragValue(value)
+        if value != self._value:
+            self._value = value
+            self.valueChanged.emit(value)
+
+    def component(self, index: int) -> float:
+        return self._value[index]
+
+    def setComponent(self, index: int, value: float):
+        values = list(self._value)
+        values[index] = value
+        self.setValue(values)
+
+    def setRange(self, minimum: float, maximum: float):
+        if minimum > maximum:
+            raise ValueError("Minimum value cannot be greater than maximum value")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.setValue(self._value)
+
+    def setDecimals(self, decimals: int):
+        self.decimal_places = decimals
+        self._valueTexts = [None] * len(self.labels)
+        self.setValue(self._value)
+        self.update()
+
+    def decimals(self) -> int:
+        return self.decimal_places
+
+    def setSingleStep(self, step: float):
+        self.step = step
+
+    def singleStep(self) -> float:
+        return self.step
+
+    def boundValue(self, value: float) -> float:
+        """Returns `value` clamped to the range and rounded to the decimal places."""
+        return round(float(min(max(value, self.minimum), self.maximum)), self.decimal_places)
+
+    def showDragValue(self, value: Sequence[float]):
+        if list(value) != self._values:
+            self._values = list(value)
+            self.update()
+
+    def count(self) -> int:
+        return len(self.labels)
+
+    def componentRect(self, index: int) -> QRect:
+        """Returns the area of a component."""
+        count = len(self.labels)
+        if self.orientation == Qt.Orientation.Vertical:
+            return QRect(0, index * (self.ROW_HEIGHT + self.SPACING), self.width(), self.ROW_HEIGHT)
+        width = (self.width() - (count - 1) * self.SPACING) / count
+        left = round(index * (width + self.SPACING))
+        return QRect(left, 0, round((index + 1) * (width + self.SPACING) - self.SPACING) - left, self.height())
+
+    def componentAt(self, pos) -> int:
+        """Returns the index of the component at `pos`, or None between components."""
+        for index in range(len(self.labels)):
+            if self.componentRect(index).contains(pos):
+                return index
+        return None
+
+    def mousePressEvent(self, event: QMouseEvent):
+        index = self.componentAt(event.pos())
+        if event.button() != Qt.MouseButton.LeftButton or index is None:
+            return super().mousePressEvent(event)
+        self.closeEditor()
+        self.isDragging = True
+        self._moved = False
+        self._dragDelta = 0.0
+        self._hoverIndex = index
+        self._dragIndices = tuple(range(len(self.labels))) if event.modifiers() & self.MULTI_EDIT_MODIFIER else (index,)
+        self.last_mouse_x = event.localPos().x()
+        self.update()
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        if not self.isDragging:
+            index = self.componentAt(event.pos())
+            if index != self._hoverIndex:
+                self._hoverIndex = index
+                self.update()
+            return super().mouseMoveEvent(event)
+
+        mouse_x = event.localPos().x()
+        if not self._moved:
+            # a click opens the editor, the drag starts with the first motion
+            self._moved = True
+            QApplication.setOverrideCursor(QCursor(Qt.CursorShape.SizeHorCursor))
+            self.startDrag(event.modifiers())
+        motion = (mouse_x - self.last_mouse_x) * self.dragSpeed(event.modifiers())
+        self.last_mouse_x = mouse_x
+        self.dragBy(motion)
+
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        if not self.isDragging:
+            return super().mouseReleaseEvent(event)
+        self.isDragging = False
+        if self._moved:
+            QApplication.restoreOverrideCursor()
+            self.endDrag()
+        else:
+            # a click without a drag types the value of the component
+            self.openEditor(self._dragIndices[0] if len(self._dragIndices) == 1 else self._hoverIndex)
+        self._dragIndices = ()
+        self.update()
+
+    def enterEvent(self, event: QEvent) -> None:
+        super().enterEvent(event)
+        self.isEnter = True
+        self.update()
+
+    def leaveEvent(self, event: QEvent) -> None:
+        super().leaveEvent(event)
+        self.isEnter = False
+        self._hoverIndex = None
+        self.update()
+
+    def beginDrag(self):
+        # dragged by its group, every component follows
+        self._dragDelta = 0.0
+        self._dragIndices = tuple(range(len(self.labels)))
+
+    def addDragMotion(self, motion: float):
+        # in value units, one single step per pixel
+        self._dragDelta += motion * self.step
+
+    def dragValue(self) -> tuple:
+        """ the displayed value, ahead of the committed one while dragging """
+        return tuple(self._values)
+
+    def flushDrag(self):
+        """ apply the pending drag motion now, e.g. when the drag ends """
+        if frameClock.isFramePending(self.applyDrag):
+            frameClock.cancelFrame(self.applyDrag)
+            self.applyDrag()
+
+    def applyDrag(self):
+        """ apply the accumulated drag motion to the dragged components, in whole decimal steps """
+        resolution = 10 ** -self.decimal_places
+        steps = int(round(self._dragDelta / resolution, 9))
+        if steps == 0:
+            return
+        self._dragDelta -= steps * resolution
+        values = list(self._values)
+        for index in self._dragIndices:
+            values[index] = self.boundValue(values[index] + steps * resolution)
+        self.setDragValue(tuple(values))
+
+    def openEditor(self, index: int):
+        """ type the value of a component in an editor, created with the first edit """
+        if self._editor is None:
+            self._editor = QLineEdit(self)
+            self._editor.returnPressed.connect(self.closeEditor)
+            self._editor.editingFinished.connect(self.closeEditor)
+            self._editor.installEventFilter(self)
+        self._editIndex = index
+        self._editor.setGeometry(self.componentRect(index))
+        self._editor.setText(self.formatValue(self._values[index]))
+        self._editor.selectAll()
+        self._editor.show()
+        self._editor.setFocus()
+
+    def closeEditor(self, accept: bool = True):
+        if self._editIndex is None:
+            return
+        index, self._editIndex = self._editIndex, None
+        self._editor.hide()
+        if accept:
+            try:
+                values = list(self._values)
+                values[index] = float(self._editor.text())
+            except ValueError:
+                # an invalid text keeps the component
+                pass
+            else:
+                self.setDragValue(tuple(values))
+                self.finishEditing()
+        self.setFocus()
+
+    def eventFilter(self, obj, event: QEvent):
+        if obj is self._editor and event.type() == QEvent.Type.KeyPress and event.key() == Qt.Key.Key_Escape:
+            self.closeEditor(accept=False)
+            return True
+        return super().eventFilter(obj, event)
+
+    def formatValue(self, value: float) -> str:
+        return f"{value:.{self.decimal_places}f}"
+
+    def valueText(self, index: int) -> tuple:
+        """ the component formatted and laid out once per value, with its width and height """
+        value = self._values[index]
+        cached = self._valueTexts[index]
+        if cached is None or cached[0] != value:
+            text = QStaticText(self.formatValue(value))
+            text.setTextFormat(Qt.TextFormat.PlainText)
+            text.prepare(font=self.font())
+            cached = self._valueTexts[index] = (value, text, text.size().width(), self.fontMetrics().height())
+        return cached
+
+    def labelText(self, index: int) -> tuple:
+        """ the label of a component laid out once, with its ascent """
+        cached = self._labelTexts[index]
+        if cached is None:
+            label = QStaticText(self.labels[index])
+            label.setTextFormat(Qt.TextFormat.PlainText)
+            label.prepare(font=self.font())
+            cached = self._labelTexts[index] = (label, self.fontMetrics().ascent())
+        return cached
+
+    def changeEvent(self, event: QEvent):
+        if event.type() == QEvent.Type.FontChange:
+            self._valueTexts = [None] * len(self.labels)
+            self._labelTexts = [None] * len(self.labels)
+        super().changeEvent(event)
+
+    def paintEvent(self, event):
+        if PushButton.buttonStyle is None:
+            PushButton.buttonStyle = PushButtonStyle()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBackgroundMode(Qt.BGMode.TransparentMode)
+        text_color = themeManager.color("@text_color")
+
+        last = len(self.labels) - 1
+        vertical = self.orientation == Qt.Orientation.Vertical
+        for index in range(len(self.labels)):
+            rect = self.componentRect(index)
+            # only the outer corners of the first and last components are rounded
+            first, end = 5 if index == 0 else 0, 5 if index == last else 0
+            radius = [first, first, end, end] if vertical else [first, end, first, end]
+
+            # 根據滑鼠動作改變顏色
+            if self.isDragging and self._moved and index in self._dragIndices:
+                color = "@widget_press_color"
+            elif self.isEnter and index == self._hoverIndex:
+                color = "@widget_hover_color"
+            else:
+                color = "@widget_color"
+            painter.translate(rect.x(), rect.y())
+            painter.fillPath(PushButton.buttonStyle.roundedRectPath(rect.width(), rect.height(), radius),
+                             themeManager.color(color))
+            painter.translate(-rect.x(), -rect.y())
+
+            if index == self._editIndex:
+                continue
+            painter.setPen(text_color)
+            label, ascent = self.labelText(index)
+            painter.drawStaticText(QPointF(rect.x() + 10, rect.y() + rect.height() / 2 + 5 - ascent), label)
+            _, value, width, height = self.valueText(index)
+            painter.drawStaticText(QPointF(rect.x() + rect.width() - width - 10, rect.y() + (rect.height() - height) / 2), value)
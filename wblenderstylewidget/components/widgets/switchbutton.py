@@ -1,7 +1,8 @@
 from PyQt5.QtWidgets import QHBoxLayout, QLabel, QToolButton, QWidget
 from PyQt5.QtGui import QColor, QPainter, QPen, QFont
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtProperty
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtProperty
 
+from common.frame_clock import frameClock
 from common.style_sheet import BlenderStyleSheet
 from .widget_base import WidgetBaseSetting
   
@@ -9,6 +10,9 @@ class Indicator(QToolButton, WidgetBaseSetting):
 
     checkedChanged = pyqtSignal(bool)
 
+    # slider travel in widths per second
+    SLIDER_SPEED = 4
+
     def __init__(self, parent):
         super().__init__(parent=parent)
         self.setCheckable(True)
@@ -17,29 +21,30 @@ class Indicator(QToolButton, WidgetBaseSetting):
         self.__sliderOnColor = QColor("#000000")
         self.__sliderOffColor = QColor("#FFFF55")
         self.__sliderDisabledColor = QColor("#FFFFFF")
-        self.timer = QTimer(self)
         self.padding = self.height()//4
         self.sliderX = self.padding
         self.sliderRadius = (self.height() -2*self.padding)//2
         self.sliderEndX = self.width()-2*self.sliderRadius
-        self.sliderStep = self.width()/50
-        self.timer.timeout.connect(self.__updateSliderPos)
-
-    def __updateSliderPos(self):
-        if self.isChecked():
-            if self.sliderX+self.sliderStep < self.sliderEndX:
-                self.sliderX += self.sliderStep
-            else:
-                self.sliderX = self.sliderEndX
-                self.timer.stop()
+
+    def __startAnimation(self):
+        """ move the slider to `sliderEndX` on the shared frame clock, or at once while hidden """
+        if self.isVisible():
+            frameClock.addListener(self.__updateSliderPos)
         else:
-            if self.sliderX-self.sliderStep > self.sliderEndX:
-                self.sliderX -= self.sliderStep
-            else:
-                self.sliderX = self.sliderEndX
-                self.timer.stop()
+            self.__stopAnimation()
 
-        self.style().polish(self)
+    def __stopAnimation(self):
+        frameClock.removeListener(self.__updateSliderPos)
+        self.sliderX = self.sliderEndX
+        self.update()
+
+    def __updateSliderPos(self, elapsed: float):
+        step = self.SLIDER_SPEED * self.width() * elapsed
+        if abs(self.sliderEndX - self.sliderX) <= step:
+            self.__stopAnimation()
+            return
+        self.sliderX += step if self.sliderEndX > self.sliderX else -step
+        self.update()
 
     def setChecked(self, isChecked: bool):
         if isChecked == self.isChecked():
@@ -47,23 +52,29 @@ class Indicator(QToolButton, WidgetBaseSetting):
         super().setChecked(isChecked)
         self.sliderEndX = self.width()-2*self.sliderRadius - \
             self.padding if self.isChecked() else self.padding
-        self.timer.start(5)
+        self.__startAnimation()
 
     def mouseReleaseEvent(self, e):
         super().mouseReleaseEvent(e)
         self.sliderEndX = self.width()-2*self.sliderRadius - \
             self.padding if self.isChecked() else self.padding
-        self.timer.start(5)
+        self.__startAnimation()
         self.checkedChanged.emit(self.isChecked())
 
     def resizeEvent(self, e):
         self.padding = self.height()//4
         self.sliderRadius = (self.height()-2*self.padding)//2
-        self.sliderStep = self.width()/50
         self.sliderEndX = self.width()-2*self.sliderRadius - \
             self.padding if self.isChecked() else self.padding
+        if not frameClock.hasListener(self.__updateSliderPos):
+            self.sliderX = self.sliderEndX
         self.update()
 
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        if frameClock.hasListener(self.__updateSliderPos):
+            self.__stopAnimation()
+
     def paintEvent(self, e):
         super().paintEvent(e)
         painter = QPainter(self)
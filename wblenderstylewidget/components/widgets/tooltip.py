@@ -1,56 +1,308 @@
-import sys
-from typing import Union
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QToolTip
-from PyQt5.QtGui import QFont, QPixmap, QIcon
-from PyQt5.QtCore import QTimer, Qt
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple, Union
+from PyQt5 import sip
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel
+from PyQt5.QtGui import QGuiApplication, QIcon, QScreen
+from PyQt5.QtCore import QEvent, QObject, QPoint, Qt, QTimer, pyqtSignal, pyqtSlot
 
+from common.icon import iconRegistry
 from common.style_sheet import BlenderStyleSheet
 
+logger = logging.getLogger(__name__)
+
 class Tooltip(QWidget):
+    """
+    A tooltip window with a title, a content text and an optional icon.
+
+    Tooltips are shown with `Tooltip.showText`, which reuses one window per screen and only swaps
+    its content, so hovering does not create windows however long the session is. `Tooltip.setToolTip`
+    registers the tooltip of a widget with the application-wide `tooltipManager`.
+
+    Usage
+    -----
+    >>> Tooltip.setToolTip(widget, "Title", "Content", delay=500)
+    >>> Tooltip.showText(widget.mapToGlobal(widget.rect().bottomLeft()), "Title", "Content")
+    >>> Tooltip.hideText()
+    """
+
+    ICON_SIZE = 32
+
+    # the pooled tooltip of each screen
+    _pool = {}  # type: Dict[QScreen, Tooltip]
+
     def __init__(self, title: str = "", content: str = "", icon: Union[QIcon, str] = None):
         super().__init__()
-        self.setGeometry(100, 100, 300, 150)
-        self.setWindowFlags(self.windowFlags() | Qt.FramelessWindowHint)  # 隱藏標題列
+        self.setWindowFlags(Qt.WindowType.ToolTip | Qt.WindowType.FramelessWindowHint)  # 隱藏標題列
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         layout = QVBoxLayout()
 
-        title_label = QLabel(title)
-        title_label.setObjectName("titleLabel")
-        layout.addWidget(title_label)
+        self.title_label = QLabel()
+        self.title_label.setObjectName("titleLabel")
+        layout.addWidget(self.title_label)
 
-        content_label = QLabel(content)
-        content_label.setObjectName("contentLabel")
-        layout.addWidget(content_label)
+        self.content_label = QLabel()
+        self.content_label.setObjectName("contentLabel")
+        layout.addWidget(self.content_label)
 
         # Icon
-        if icon:
-            icon_label = QLabel()
-            pixmap = QPixmap(icon)
-            icon_label.setPixmap(pixmap)
-            layout.addWidget(icon_label)
+        self.icon_label = QLabel()
+        self.icon_label.hide()
+        layout.addWidget(self.icon_label)
 
         self.setLayout(layout)
         BlenderStyleSheet.TOOLTIP.apply(self)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.showTooltip)
+        self._icon = None
+        self.setContent(title, content, icon)
+
+    def setContent(self, title: str = "", content: str = "", icon: Union[QIcon, str] = None):
+        """Swaps the title, the content and the icon, touching only what changed."""
+        if self.title_label.text() != title:
+            self.title_label.setText(title)
+        if self.content_label.text() != content:
+            self.content_label.setText(content)
+        if icon != self._icon:
+            self._icon = icon
+            if icon:
+                if isinstance(icon, QIcon):
+                    pixmap = icon.pixmap(self.ICON_SIZE)
+                else:
+                    pixmap = iconRegistry.pixmap(icon, self.ICON_SIZE, self.devicePixelRatioF())
+                self.icon_label.setPixmap(pixmap)
+            self.icon_label.setVisible(bool(icon))
+        self.adjustSize()
+
+    @classmethod
+    def instance(cls, screen: QScreen = None) -> 'Tooltip':
+        """Returns the pooled tooltip of `screen`, the primary screen by default, creating it once."""
+        screen = screen or QGuiApplication.primaryScreen()
+        tooltip = cls._pool.get(screen)
+        if tooltip is None:
+            if not cls._pool:
+                QApplication.instance().screenRemoved.connect(cls._releaseScreen)
+            tooltip = cls._pool[screen] = cls()
+        return tooltip
+
+    @classmethod
+    def liveCount(cls) -> int:
+        """Returns the number of tooltip windows alive, at most one per screen."""
+        return len(cls._pool)
+
+    @classmethod
+    def showText(cls, pos: QPoint, title: str = "", content: str = "", icon: Union[QIcon, str] = None):
+        """Shows the tooltip of the screen at `pos` with this content, hiding the others."""
+        screen = QGuiApplication.screenAt(pos)
+        tooltip = cls.instance(screen)
+        for other in cls._pool.values():
+            if other is not tooltip:
+                other.hide()
+        tooltip.setContent(title, content, icon)
+        tooltip.move(pos)
+        tooltip.show()
+
+    @classmethod
+    def hideText(cls):
+        for tooltip in cls._pool.values():
+            tooltip.hide()
+
+    @classmethod
+    def _releaseScreen(cls, screen: QScreen):
+        tooltip = cls._pool.pop(screen, None)
+        if tooltip is not None:
+            tooltip.deleteLater()
 
     @staticmethod
-    def setToolTip(widget, title="", content="", icon=None, delay=1000):
-        widget.setToolTip("")  # 清空原生的 ToolTip
+    def setToolTip(widget: QWidget, title="", content="", icon=None, delay=1000, background=False):
+        """Shows this tooltip when the mouse rests on `widget` for `delay` milliseconds.
+
+        The title, the content and the icon may be callables, evaluated once when the tooltip is
+        first shown, in a worker thread if `background` is True.
+        """
+        tooltipManager.setToolTip(widget, title, content, icon, delay, background)
+
+class TooltipManager(QObject):
+    """ Application-wide registry of the tooltips of the widgets
+
+    One event filter, installed on the registered widgets only, and one
+    delay timer serve every widget, so a tooltip costs a registry entry
+    until its widget is hovered. The entries are keyed by the address of
+    the widget, so the registry does not keep the widgets alive, and are
+    dropped when their widget is destroyed.
+
+    The parts of a tooltip may be providers, callables evaluated when the
+    tooltip is about to show and memoized until `invalidateToolTip`.
+    Background providers run in a worker thread from the moment the widget
+    is entered, and the tooltip shows when both the delay and the provider
+    are done; they must not touch widgets. A failing provider is logged and
+    its tooltip not shown, and it does not run again until `invalidateToolTip`.
+    The worker threads stop when the application quits.
+    """
+
+    # the memoized content of a tooltip whose provider failed
+    FAILED = ()
+
+    # emitted from the worker thread, received in the GUI thread
+    _computed = pyqtSignal(object, object)
+
+    # events ending the hover of a widget
+    HIDE_EVENTS = frozenset((QEvent.Type.Leave, QEvent.Type.Hide, QEvent.Type.MouseButtonPress, QEvent.Type.Wheel))
+    WATCHED_EVENTS = HIDE_EVENTS | {QEvent.Type.Enter, QEvent.Type.ToolTip}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tooltips = {}     # type: Dict[int, Tuple]
+        self._contents = {}     # type: Dict[int, Tuple]
+        self._pending = {}      # type: Dict[int, Future]
+        self._executor = None
+        self._hovered = None
+        self._shown = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._showHovered)
+        self._computed.connect(self._onComputed)
+
+    @staticmethod
+    def _key(widget: QObject) -> int:
+        # the same for the wrapper a destroyed signal carries
+        return sip.unwrapinstance(widget)
+
+    def setToolTip(self, widget: QWidget, title: Union[str, Callable[[], str]] = "",
+                   content: Union[str, Callable[[], str]] = "", icon=None, delay=1000, background=False):
+        """ register the tooltip of `widget`, replacing its previous one """
+        key = self._key(widget)
+        if key not in self._tooltips:
+            widget.setToolTip("")  # 清空原生的 ToolTip
+            widget.installEventFilter(self)
+            widget.destroyed.connect(self._onDestroyed)
+        self._tooltips[key] = (title, content, icon, delay, background)
+        self.invalidateToolTip(widget)
+
+    def removeToolTip(self, widget: QWidget):
+        if sip.isdeleted(widget):
+            # forgotten when it was destroyed
+            return
+        if self._forget(self._key(widget)):
+            widget.removeEventFilter(self)
+            widget.destroyed.disconnect(self._onDestroyed)
+
+    @pyqtSlot(QObject)
+    def _onDestroyed(self, widget: QObject):
+        # a slot of the manager costs the widget no connection proxy, unlike a Python callable
+        self._forget(self._key(widget))
+
+    def _forget(self, key: int) -> bool:
+        if self._tooltips.pop(key, None) is None:
+            return False
+        self._contents.pop(key, None)
+        self._pending.pop(key, None)
+        if self._hovered is not None and (sip.isdeleted(self._hovered) or self._key(self._hovered) == key):
+            self.hideToolTip()
+        return True
+
+    def toolTip(self, widget: QWidget) -> Tuple:
+        """ the (title, content, icon, delay, background) of `widget`, or None """
+        return None if sip.isdeleted(widget) else self._tooltips.get(self._key(widget))
+
+    def invalidateToolTip(self, widget: QWidget = None):
+        """ forget the evaluated providers of `widget`, or of every widget, e.g. when their data changed """
+        if widget is None:
+            self._contents.clear()
+            self._pending.clear()
+        else:
+            key = self._key(widget)
+            self._contents.pop(key, None)
+            self._pending.pop(key, None)
+        if self._shown is not None and (widget is None or widget is self._shown):
+            self._showHovered()
+
+    def content(self, widget: QWidget) -> Optional[Tuple]:
+        """ the (title, content, icon) of `widget`, None while a background provider computes it or if it failed """
+        key = self._key(widget)
+        content = self._contents.get(key)
+        if content is not None:
+            return content or None
+        title, text, icon, _, background = self._tooltips[key]
+        if not background:
+            try:
+                content = self._evaluate(title, text, icon)
+            except Exception:
+                logger.exception("Tooltip provider failed")
+                content = self.FAILED
+            self._contents[key] = content
+            return content or None
+        if key not in self._pending:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tooltip")
+                QApplication.instance().aboutToQuit.connect(self.shutdown)
+            future = self._pending[key] = self._executor.submit(self._evaluate, title, text, icon)
+            future.add_done_callback(lambda future: self._computed.emit(key, future))
+        return None
+
+    @staticmethod
+    def _evaluate(*parts) -> Tuple:
+        return tuple(part() if callable(part) else part for part in parts)
+
+    def _onComputed(self, key: int, future: Future):
+        # a result invalidated while computed, or of a destroyed widget, is dropped
+        if self._pending.get(key) is not future:
+            return
+        del self._pending[key]
+        try:
+            self._contents[key] = future.result()
+        except Exception:
+            logger.exception("Tooltip provider failed")
+            self._contents[key] = self.FAILED
+            return
+        if self._hovered is not None and self._key(self._hovered) == key and not self._timer.isActive():
+            self._showHovered()
+
+    def shutdown(self):
+        """ stop the worker threads, dropping the providers not started yet """
+        if self._executor is not None:
+            QApplication.instance().aboutToQuit.disconnect(self.shutdown)
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._pending.clear()
 
-        def startTimer():
-            widget.timer.start(delay)
+    def hideToolTip(self):
+        self._timer.stop()
+        self._hovered = self._shown = None
+        Tooltip.hideText()
 
-        def stopTimer(event):  # 不接受任何參數
-            widget.timer.stop()
+    def eventFilter(self, obj, event: QEvent):
+        # the registered widgets send every event here, most of them return at once
+        eventType = event.type()
+        if eventType not in self.WATCHED_EVENTS:
+            return False
+        if eventType == QEvent.Type.Enter:
+            tooltip = self._tooltips.get(self._key(obj))
+            if tooltip is not None:
+                self._hovered = obj
+                self._timer.start(tooltip[3])
+                if tooltip[4]:
+                    # a background provider starts with the delay
+                    self.content(obj)
+        elif eventType == QEvent.Type.ToolTip:
+            # the native tooltip of a registered widget is replaced
+            return self._key(obj) in self._tooltips
+        elif obj is self._hovered:
+            self.hideToolTip()
+        return False
 
-        def showTooltip():
-            tooltip = Tooltip(title, content, icon)
-            tooltip.move(widget.mapToGlobal(widget.rect().bottomLeft()))  # 在底部左側顯示
-            tooltip.show()
+    def _showHovered(self):
+        widget = self._hovered
+        if widget is None or sip.isdeleted(widget) or not widget.isVisible():
+            self._hovered = self._shown = None
+            return
+        content = self.content(widget)
+        if content is None:
+            # shown by _onComputed
+            return
+        title, content, icon = content
+        self._shown = widget
+        # 在底部左側顯示
+        Tooltip.showText(widget.mapToGlobal(widget.rect().bottomLeft()), title, content, icon)
 
-        widget.enterEvent = startTimer
-        widget.leaveEvent = stopTimer
-        widget.showEvent = stopTimer
-        widget.hideEvent = stopTimer
-        widget.showTooltip = showTooltip
\ No newline at end of file
+tooltipManager = TooltipManager()
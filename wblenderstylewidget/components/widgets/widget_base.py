@@ -1,6 +1,11 @@
+import math
+import time
+
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import QSizePolicy, QWidget
 from PyQt5.QtGui import QFont, QMouseEvent
 
+from common.frame_clock import frameClock
 from common.style_sheet import BlenderStyleSheet
 
 class WidgetBaseSetting(QWidget):
@@ -32,4 +37,116 @@ class WidgetBaseSetting(QWidget):
     def setFixedHeight(self, height):
         default_height = 30
         new_height = height if height is not None else default_height
-        super().setFixedHeight(new_height)
\ No newline at end of file
+        super().setFixedHeight(new_height)
+
+class ValueTracking:
+    """
+    QSlider-like tracking and throttling of the value a widget changes while it is dragged.
+
+    With tracking, the dragged value is committed with `setValue`, which emits `valueChanged`,
+    at most once per `throttleInterval` milliseconds. Without tracking, it is committed only
+    when the edit finishes. Either way the last value is always committed when the edit finishes,
+    before `editingFinished` is emitted.
+
+    Widgets call `initValueTracking` once, `setDragValue` for every dragged value, `finishEditing`
+    on release or Enter, and implement `showDragValue` to display a value not committed yet.
+
+    A widget added to a `DragGroup` calls `startDrag` on press, `dragBy` with the mouse motion and
+    `endDrag` on release, and implements `beginDrag`, `addDragMotion`, `applyDrag` and `dragValue`,
+    so that the group can drive its drag together with the other widgets of the group.
+
+    Every dragged widget moves `PRECISION_FACTOR` times slower while `PRECISION_MODIFIER` is held.
+    """
+
+    # drag speed while the precision modifier is held, shared by every dragged widget
+    PRECISION_MODIFIER = Qt.KeyboardModifier.ShiftModifier
+    PRECISION_FACTOR = 0.1
+
+    def initValueTracking(self):
+        self._tracking = True
+        self._throttleInterval = 0
+        self._pendingValue = None
+        self._lastCommit = 0.0
+        self._throttleTimer = None
+        self._dragGroup = None
+        self._groupDrag = False
+
+    def setTracking(self, enable: bool):
+        """If tracking is disabled, `valueChanged` is only emitted when the edit finishes."""
+        self._tracking = enable
+
+    def hasTracking(self) -> bool:
+        return self._tracking
+
+    def setThrottleInterval(self, msec: int):
+        """Sets the minimum time between two `valueChanged` emitted while dragging, 0 for no limit."""
+        self._throttleInterval = max(0, int(msec))
+
+    def throttleInterval(self) -> int:
+        return self._throttleInterval
+
+    def setDragValue(self, value):
+        """Displays a dragged value, and commits it as allowed by the tracking and the throttle."""
+        self._pendingValue = value
+        self.showDragValue(value)
+        if not self._tracking:
+            return
+
+        remaining = self._throttleInterval - (time.perf_counter() - self._lastCommit) * 1000
+        if remaining <= 0:
+            self.commitValue()
+        else:
+            if self._throttleTimer is None:
+                self._throttleTimer = QTimer(self)
+                self._throttleTimer.setSingleShot(True)
+                self._throttleTimer.timeout.connect(self.commitValue)
+            if not self._throttleTimer.isActive():
+                self._throttleTimer.start(math.ceil(remaining))
+
+    def commitValue(self):
+        """Commits the pending dragged value with `setValue`."""
+        if self._throttleTimer is not None:
+            self._throttleTimer.stop()
+        if self._pendingValue is None:
+            return
+        value, self._pendingValue = self._pendingValue, None
+        self._lastCommit = time.perf_counter()
+        self.setValue(value)
+
+    def finishEditing(self):
+        """Commits the last value and emits `editingFinished`."""
+        self.commitValue()
+        self.editingFinished.emit()
+
+    def showDragValue(self, value):
+        raise NotImplementedError
+
+    def dragSpeed(self, modifiers) -> float:
+        """Returns the factor of the dragged motion, `PRECISION_FACTOR` while `PRECISION_MODIFIER` is held."""
+        return self.PRECISION_FACTOR if modifiers & self.PRECISION_MODIFIER else 1
+
+    def dragGroup(self):
+        """Returns the `DragGroup` of the widget, or None."""
+        return self._dragGroup
+
+    def startDrag(self, modifiers):
+        """Starts a drag, driving the whole drag group of the widget if `modifiers` link it."""
+        group = self._dragGroup
+        self._groupDrag = group is not None and group.beginDrag(self, modifiers)
+
+    def dragBy(self, motion: float):
+        """Applies `motion` pixels of drag, scaled by the precision, on the next frame."""
+        if self._groupDrag:
+            self._dragGroup.addMotion(motion)
+        else:
+            self.addDragMotion(motion)
+            frameClock.requestFrame(self.applyDrag)
+
+    def endDrag(self):
+        """Applies the pending motion and finishes the edit of the widget, or of its drag group."""
+        if self._groupDrag:
+            self._groupDrag = False
+            self._dragGroup.finishDrag()
+        else:
+            self.flushDrag()
+            self.finishEditing()
@@ -0,0 +1,521 @@
+"""
+Micro-benchmarks of the widgets, run under the offscreen platform by default:
+
+    python wblenderstylewidget/examples/benchmark.py [name ...]
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+grandparent_dir = os.path.dirname(parent_dir)
+sys.path.insert(0, parent_dir)
+sys.path.insert(0, grandparent_dir)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QEvent, QPointF, Qt
+from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtWidgets import QApplication, QPushButton, QWidget
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+from components.widgets import *
+
+@contextmanager
+def countCalls(owner, name: str):
+    """ count the calls of `owner.name` made inside the block """
+    counter = {"calls": 0}
+    original = getattr(owner, name)
+    # the descriptor itself is restored, as a PyQt method read from its class is no longer one
+    descriptor = vars(owner).get(name)
+
+    def wrapper(self, *args, **kwargs):
+        counter["calls"] += 1
+        return original(self, *args, **kwargs)
+
+    setattr(owner, name, wrapper)
+    try:
+        yield counter
+    finally:
+        if descriptor is None:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, descriptor)
+
+def benchmarkStyleUpdates():
+    """ setStyleSheet calls made by PushButton and the application while building composite widgets """
+    for name, factory in [
+        ("RadioButtonGroup x 100", lambda: RadioButtonGroup([f"Option {i}" for i in range(100)])),
+        ("SearchLineEdit x 100", lambda: [SearchLineEdit() for _ in range(100)]),
+    ]:
+        with countCalls(PushButton, "requestQssUpdate") as requests, \
+             countCalls(PushButton, "setStyleSheet") as applied, \
+             countCalls(QApplication, "setStyleSheet") as installed:
+            start = time.perf_counter()
+            widgets = factory()
+            app.processEvents()
+            elapsed = time.perf_counter() - start
+        print(f"{name:<28} {requests['calls']:>6} style requests  {applied['calls']:>6} setStyleSheet calls  "
+              f"{installed['calls']:>3} installs  {elapsed * 1000:8.1f} ms")
+        del widgets
+
+def baselineToggle(button: QPushButton, toggled: bool):
+    """ the toggle of the original ToggleButton, swapping its colors and applying the regenerated qss """
+    background, hover, press = ("#4772b3", "#628bca", "#628bca") if toggled else ("#545454", "#656565", "#4772b3")
+    button.setStyleSheet(f"""
+        QPushButton#PushButton {{
+            background-color: {background};
+            border-top-left-radius: 5px;
+            border-top-right-radius: 5px;
+            border-bottom-left-radius: 5px;
+            border-bottom-right-radius: 5px;
+            color: white;
+            font-family: Arial, Helvetica, sans-serif;
+            font-size: 14px;
+            padding-left: 3px;
+            padding-right: 3px;
+            text-align: center;
+        }}
+        QPushButton#PushButton:hover {{
+            background-color: {hover};
+        }}
+        QPushButton#PushButton:pressed {{
+            background-color: {press};
+        }}
+    """)
+
+def benchmarkToggles(count: int = 10000):
+    """ toggling a button by regenerating its qss, as the original ToggleButton did, by its checked state and by painting """
+    def plainButton():
+        button = QPushButton("Toggle")
+        button.setObjectName("PushButton")
+        return button
+
+    def toggleButton(renderMode):
+        button = ToggleButton("Toggle")
+        button.setRenderMode(renderMode)
+        return button
+
+    for name, factory, toggle in [
+        ("qss rebuild", plainButton, baselineToggle),
+        ("checked state", lambda: toggleButton(PushButton.RenderMode.STYLE_SHEET), ToggleButton.setChecked),
+        ("painter", lambda: toggleButton(PushButton.RenderMode.PAINTER), ToggleButton.setChecked),
+    ]:
+        button = factory()
+        button.resize(120, 24)
+        button.show()
+        app.processEvents()
+        toggled = False
+        with countCalls(QWidget, "setStyleSheet") as applied:
+            start = time.perf_counter()
+            for _ in range(count):
+                toggled = not toggled
+                toggle(button, toggled)
+                button.repaint()
+            elapsed = time.perf_counter() - start
+        print(f"{name:<16} {count} toggles  {applied['calls']:>6} setStyleSheet calls  "
+              f"{elapsed * 1000:8.1f} ms  {elapsed / count * 1e6:6.1f} us/toggle")
+        button.deleteLater()
+    app.processEvents()
+
+def frameTimes(widget, frames: int, step=None) -> str:
+    """ repaint `widget` `frames` times, calling `step` before each frame """
+    times = []
+    for frame in range(frames):
+        if step is not None:
+            step(frame)
+        start = time.perf_counter()
+        widget.repaint()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return (f"mean {sum(times) / frames * 1e6:7.1f} us  p50 {times[frames // 2] * 1e6:7.1f} us  "
+            f"p99 {times[frames * 99 // 100] * 1e6:7.1f} us")
+
+def benchmarkSpinBoxPaint(frames: int = 5000):
+    """ paint time of the spin boxes, unchanged and while scrubbing their value """
+    for name, factory, text in [
+        ("int labelled", PlainSpinBox, "Width"),
+        ("int plain", PlainSpinBox, None),
+        ("float labelled", PlainDoubleSpinBox, "Scale"),
+        ("float plain", PlainDoubleSpinBox, None),
+    ]:
+        spin_box = factory(text=text)
+        spin_box.resize(200, 24)
+        spin_box.show()
+        app.processEvents()
+        resolution = spin_box.valueResolution()
+        def scrub(frame):
+            spin_box.value = spin_box.roundValue(frame * resolution)
+        print(f"{name:<15} static    {frameTimes(spin_box, frames)}")
+        print(f"{name:<15} scrubbing {frameTimes(spin_box, frames, scrub)}")
+        spin_box.deleteLater()
+    app.processEvents()
+
+def mouseEvent(type: QEvent.Type, x: float, buttons=Qt.MouseButton.LeftButton) -> QMouseEvent:
+    return QMouseEvent(type, QPointF(x, 10), Qt.MouseButton.LeftButton, buttons, Qt.KeyboardModifier.NoModifier)
+
+def benchmarkDrag(rate: int = 1000, duration: float = 1.0):
+    """ valueChanged emissions and repaints of a drag fed by a `rate` Hz mouse """
+    for name, factory in [("PlainSpinBox", PlainSpinBox), ("PlainDoubleSpinBox", PlainDoubleSpinBox),
+                          ("ProgressBarSlider", ProgressBarSlider)]:
+        widget = factory()
+        widget.resize(200, 24)
+        widget.show()
+        app.processEvents()
+        emissions = []
+        # the slider carries its float value in its own signal
+        signal = widget.floatValueChanged if isinstance(widget, ProgressBarSlider) else widget.valueChanged
+        signal.connect(emissions.append)
+
+        events = int(rate * duration)
+        x = 0.0
+        with countCalls(type(widget), "paintEvent") as paints:
+            app.sendEvent(widget, mouseEvent(QEvent.Type.MouseButtonPress, x))
+            start = time.perf_counter()
+            for event in range(events):
+                # 0.2 px per event, so whole steps only come from accumulated motion
+                x += 0.2
+                app.sendEvent(widget, mouseEvent(QEvent.Type.MouseMove, x))
+                app.processEvents()
+                while time.perf_counter() - start < (event + 1) / rate:
+                    pass
+            app.sendEvent(widget, mouseEvent(QEvent.Type.MouseButtonRelease, x, Qt.MouseButton.NoButton))
+            app.processEvents()
+            elapsed = time.perf_counter() - start
+        print(f"{name:<18} {events} mouse events  {len(emissions):>5} valueChanged  "
+              f"{paints['calls']:>5} paints  in {elapsed:.2f} s  final value {emissions[-1] if emissions else None}")
+        widget.deleteLater()
+    app.processEvents()
+
+def residentMemory() -> int:
+    """ resident set size of the process in bytes, 0 where it cannot be read """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+def benchmarkSpinBoxConstruction(count: int = 5000):
+    """ construction time and resident memory of a panel of spin boxes, with deferred editor configuration """
+    import gc
+    for name, factory in [("PlainSpinBox", PlainSpinBox), ("PlainDoubleSpinBox", PlainDoubleSpinBox)]:
+        factory(text="warm up").deleteLater()
+        app.processEvents()
+        gc.collect()
+        memory = residentMemory()
+        panel = QWidget()
+        start = time.perf_counter()
+        spin_boxes = [factory(text=f"Value {i}", parent=panel) for i in range(count)]
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        grown = residentMemory() - memory
+        print(f"{name:<18} {count} spin boxes  {elapsed * 1000:8.1f} ms  "
+              f"{elapsed / count * 1e6:6.1f} us each  RSS +{grown / 2 ** 20:6.1f} MiB  "
+              f"{grown / count / 1024:5.1f} KiB each")
+        del spin_boxes
+        panel.deleteLater()
+        app.processEvents()
+
+def benchmarkButtonSpinBox(count: int = 1000):
+    """ construction and first layout of a panel of ButtonSpinBox """
+    from PyQt5.QtWidgets import QVBoxLayout
+    memory = residentMemory()
+    panel = QWidget()
+    layout = QVBoxLayout(panel)
+    start = time.perf_counter()
+    spin_boxes = [ButtonSpinBox(text=f"Value {i}") for i in range(count)]
+    built = time.perf_counter()
+    for spin_box in spin_boxes:
+        layout.addWidget(spin_box)
+    panel.resize(240, count * 32)
+    panel.show()
+    app.processEvents()
+    shown = time.perf_counter()
+    print(f"ButtonSpinBox x {count}  {len(panel.findChildren(QWidget)):>6} widgets  "
+          f"construction {(built - start) * 1000:8.1f} ms  layout and show {(shown - built) * 1000:8.1f} ms  "
+          f"RSS +{(residentMemory() - memory) / 2 ** 20:6.1f} MiB")
+    panel.deleteLater()
+    app.processEvents()
+
+def benchmarkVectorSpinBox(count: int = 1000):
+    """ a panel of XYZ fields as VectorSpinBox against three PlainDoubleSpinBox each """
+    from PyQt5.QtWidgets import QVBoxLayout
+    for name, factory in [
+        ("PlainDoubleSpinBox x 3", lambda: [PlainDoubleSpinBox(text=axis) for axis in "XYZ"]),
+        ("VectorSpinBox", lambda: [VectorSpinBox(("X", "Y", "Z"))]),
+    ]:
+        memory = residentMemory()
+        panel = QWidget()
+        layout = QVBoxLayout(panel)
+        start = time.perf_counter()
+        for _ in range(count):
+            for widget in factory():
+                layout.addWidget(widget)
+        panel.resize(240, count * 96)
+        panel.show()
+        app.processEvents()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<24} x {count}  {len(panel.findChildren(QWidget)):>6} widgets  "
+              f"construction and show {elapsed * 1000:8.1f} ms  "
+              f"RSS +{(residentMemory() - memory) / 2 ** 20:6.1f} MiB")
+        panel.deleteLater()
+        app.processEvents()
+
+def benchmarkDragGroup(rate: int = 1000, duration: float = 1.0):
+    """ frames, repaints and notifications of a `rate` Hz drag driving 1 and 50 linked fields """
+    for count in (1, 50):
+        panel = QWidget()
+        panel.resize(240, count * 24)
+        fields = []
+        for index in range(count):
+            field = PlainDoubleSpinBox(parent=panel) if index % 2 else ProgressBarSlider(parent=panel)
+            field.setGeometry(0, index * 24, 200, 24)
+            field.setTracking(False)
+            fields.append(field)
+        group = DragGroup(fields, modifier=None)
+        notifications = []
+        group.valuesChanged.connect(notifications.append)
+        panel.show()
+        app.processEvents()
+
+        source = fields[0]
+        events = int(rate * duration)
+        x = 0.0
+        with countCalls(DragGroup, "applyDrag") as frames, \
+             countCalls(PlainDoubleSpinBox, "paintEvent") as spinBoxPaints, \
+             countCalls(ProgressBarSlider, "paintEvent") as sliderPaints:
+            app.sendEvent(source, mouseEvent(QEvent.Type.MouseButtonPress, x))
+            start = time.perf_counter()
+            for event in range(events):
+                x += 0.2
+                app.sendEvent(source, mouseEvent(QEvent.Type.MouseMove, x))
+                app.processEvents()
+                while time.perf_counter() - start < (event + 1) / rate:
+                    pass
+            app.sendEvent(source, mouseEvent(QEvent.Type.MouseButtonRelease, x, Qt.MouseButton.NoButton))
+            app.processEvents()
+            elapsed = time.perf_counter() - start
+        paints = spinBoxPaints["calls"] + sliderPaints["calls"]
+        print(f"{count:>3} fields  {events} mouse events  {frames['calls']:>4} frames  "
+              f"{paints / count:6.1f} paints per field  {len(notifications):>4} valuesChanged  in {elapsed:.2f} s")
+        panel.deleteLater()
+        app.processEvents()
+
+def benchmarkSwitchAnimation(count: int = 100):
+    """ GUI thread load of `count` switches animating at once on the shared frame clock """
+    from PyQt5.QtCore import QEventLoop, QTimer
+    from PyQt5.QtWidgets import QVBoxLayout
+    from common.frame_clock import frameClock
+    panel = QWidget()
+    layout = QVBoxLayout(panel)
+    switches = [SwitchButton(f"Switch {i}") for i in range(count)]
+    for switch in switches:
+        layout.addWidget(switch)
+    panel.show()
+    app.processEvents()
+
+    indicator = type(switches[0].indicator)
+    loop = QEventLoop()
+    poll = QTimer()
+    def animating():
+        return any(frameClock.hasListener(switch.indicator._Indicator__updateSliderPos) for switch in switches)
+    poll.timeout.connect(lambda: None if animating() else loop.quit())
+    with countCalls(indicator, "_Indicator__updateSliderPos") as ticks, \
+         countCalls(indicator, "paintEvent") as paints:
+        start, cpu = time.perf_counter(), time.process_time()
+        for switch in switches:
+            switch.toggleChecked()
+        poll.start(50)
+        loop.exec_()
+        elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu
+    poll.stop()
+    print(f"{count} switches  animation {elapsed * 1000:6.1f} ms  {ticks['calls'] / count:5.1f} ticks each  "
+          f"{paints['calls'] / count:5.1f} paints each  GUI thread load {cpu / elapsed * 100:5.1f} %")
+    panel.deleteLater()
+    app.processEvents()
+
+def benchmarkTooltipSoak(hovers: int = 10000):
+    """ live tooltip windows and resident memory over `hovers` hovers of changing content """
+    import gc
+    from PyQt5.QtCore import QPoint
+    from components.widgets.tooltip import Tooltip
+    Tooltip.showText(QPoint(0, 0), "warm up")
+    Tooltip.hideText()
+    app.processEvents()
+    gc.collect()
+    memory = residentMemory()
+    start = time.perf_counter()
+    for hover in range(hovers):
+        Tooltip.showText(QPoint(hover % 500, 100), f"Property {hover % 100}", f"Row {hover}")
+        app.processEvents()
+        Tooltip.hideText()
+        if (hover + 1) % (hovers // 4) == 0:
+            gc.collect()
+            windows = sum(isinstance(widget, Tooltip) for widget in app.topLevelWidgets())
+            print(f"{hover + 1:>6} hovers  {windows} tooltip windows  "
+                  f"RSS +{(residentMemory() - memory) / 2 ** 20:5.1f} MiB  "
+                  f"{(time.perf_counter() - start) / (hover + 1) * 1e6:6.1f} us/hover")
+
+def benchmarkTooltipDispatch(count: int = 5000, events: int = 100000):
+    """ registration cost and event dispatch of `count` property rows with and without tooltips """
+    import gc
+    from PyQt5.QtCore import QEvent
+    from components.widgets.tooltip import tooltipManager
+    for name, register in [("no tooltips", False), ("tooltips", True)]:
+        panel = QWidget()
+        rows = [QWidget(panel) for _ in range(count)]
+        gc.collect()
+        memory = residentMemory()
+        start = time.perf_counter()
+        if register:
+            for index, row in enumerate(rows):
+                tooltipManager.setToolTip(row, f"Property {index}", "Description")
+        registered = time.perf_counter() - start
+        gc.collect()
+        grown = residentMemory() - memory
+
+        start = time.perf_counter()
+        for event in range(events):
+            app.sendEvent(rows[event % count], QEvent(QEvent.Type.User if event % 2 else QEvent.Type.UpdateLater))
+        dispatch = time.perf_counter() - start
+        print(f"{name:<12} {count} rows  register {registered * 1000:6.1f} ms  RSS +{grown / 1024:7.1f} KiB  "
+              f"dispatch {dispatch / events * 1e6:5.2f} us/event")
+        for row in rows if register else ():
+            tooltipManager.removeToolTip(row)
+        panel.deleteLater()
+        app.processEvents()
+
+def benchmarkTooltipProviders(count: int = 5000, hovers: int = 20):
+    """ building the tooltips of `count` rows eagerly against lazy providers, of which `hovers` are shown """
+    from components.widgets.tooltip import tooltipManager
+    evaluated = {"calls": 0}
+
+    def describe(index: int) -> str:
+        # stands for a costly query of the bound data
+        evaluated["calls"] += 1
+        return "\n".join(f"{key}: {hash((index, key)) % 1000}" for key in range(200))
+
+    for name, lazy in [("eager strings", False), ("lazy providers", True)]:
+        panel = QWidget()
+        rows = [QWidget(panel) for _ in range(count)]
+        evaluated["calls"] = 0
+        start = time.perf_counter()
+        for index, row in enumerate(rows):
+            content = (lambda index=index: describe(index)) if lazy else describe(index)
+            tooltipManager.setToolTip(row, f"Property {index}", content)
+        registered = time.perf_counter() - start
+        start = time.perf_counter()
+        for hover in range(hovers):
+            for _ in range(3):
+                tooltipManager.content(rows[hover * 7])
+        shown = time.perf_counter() - start
+        print(f"{name:<15} {count} rows  register {registered * 1000:7.1f} ms  "
+              f"{hovers} x 3 hovers {shown * 1000:6.1f} ms  {evaluated['calls']:>5} evaluations")
+        for row in rows:
+            tooltipManager.removeToolTip(row)
+        panel.deleteLater()
+        app.processEvents()
+
+def benchmarkListPopulate(frames: int = 500):
+    """ populate time, resident memory and scroll frame time of ListWidget against ListView """
+    import gc
+    for name, factory, count in [
+        ("ListWidget", ListWidget, 100000),
+        ("ListView", ListView, 100000),
+        ("ListView", ListView, 1000000),
+    ]:
+        entries = [f"Object {i}" for i in range(count)]
+        gc.collect()
+        memory = residentMemory()
+        widget = factory()
+        widget.resize(300, 600)
+        start = time.perf_counter()
+        for section in range(0, count, count // 10):
+            widget.addItems(entries[section:section + count // 10 - 1])
+            widget.addSeparator()
+        widget.show()
+        app.processEvents()
+        shown = time.perf_counter() - start
+        # ListView lays out large lists in batches between events, scrolled to the end while it does
+        scrollBar = widget.verticalScrollBar()
+        layoutFrames = []
+        while isinstance(widget, ListView) and \
+                scrollBar.maximum() < count * widget.sizeHintForRow(0) - widget.viewport().height():
+            frame = time.perf_counter()
+            scrollBar.setValue(scrollBar.maximum())
+            widget.viewport().repaint()
+            app.processEvents()
+            layoutFrames.append(time.perf_counter() - frame)
+        populated = time.perf_counter() - start
+        gc.collect()
+        grown = residentMemory() - memory
+
+        step = max(1, scrollBar.maximum() // frames)
+        print(f"{name:<10} {count:>7} entries  first show {shown * 1000:7.1f} ms  laid out {populated * 1000:7.1f} ms  "
+              f"RSS +{grown / 2 ** 20:6.1f} MiB\n{'':<10} scroll {frameTimes(widget.viewport(), frames, lambda frame: scrollBar.setValue(frame * step))}")
+        if layoutFrames:
+            layoutFrames.sort()
+            print(f"{'':<10} scroll while laying out  {len(layoutFrames)} frames  "
+                  f"p50 {layoutFrames[len(layoutFrames) // 2] * 1000:5.1f} ms  max {layoutFrames[-1] * 1000:5.1f} ms")
+        widget.deleteLater()
+        app.processEvents()
+        del entries
+
+def benchmarkListRemoval(count: int = 20000, selected: int = 5000):
+    """ removing `selected` selected entries, in runs of 50, item by item against range by range """
+    from PyQt5.QtCore import QItemSelection, QItemSelectionModel
+
+    def removeItemByItem(widget):
+        # the former remove_selected_item
+        for item in widget.selectedItems():
+            widget.takeItem(widget.row(item))
+
+    for name, factory, remove in [
+        ("ListWidget item by item", ListWidget, removeItemByItem),
+        ("ListWidget ranges", ListWidget, ListWidget.remove_selected_item),
+        ("ListView ranges", ListView, ListView.remove_selected_item),
+    ]:
+        widget = factory()
+        widget.setSelectionMode(widget.SelectionMode.ExtendedSelection)
+        widget.addItems([f"Object {i}" for i in range(count)])
+        selection = QItemSelection()
+        for first in range(0, selected * 2, 100):
+            selection.select(widget.model().index(first, 0), widget.model().index(first + 49, 0))
+        widget.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select)
+        removals = []
+        widget.model().rowsRemoved.connect(lambda parent, first, last: removals.append(last - first + 1))
+        start = time.perf_counter()
+        remove(widget)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<24} {count} entries  {sum(removals)} removed  {len(removals):>5} notifications  "
+              f"{elapsed * 1000:8.1f} ms")
+        widget.deleteLater()
+        app.processEvents()
+
+BENCHMARKS = {
+    "style": benchmarkStyleUpdates,
+    "toggle": benchmarkToggles,
+    "spinbox-paint": benchmarkSpinBoxPaint,
+    "drag": benchmarkDrag,
+    "spinbox-construct": benchmarkSpinBoxConstruction,
+    "buttonspinbox": benchmarkButtonSpinBox,
+    "vector": benchmarkVectorSpinBox,
+    "draggroup": benchmarkDragGroup,
+    "switch": benchmarkSwitchAnimation,
+    "tooltip-soak": benchmarkTooltipSoak,
+    "tooltip-dispatch": benchmarkTooltipDispatch,
+    "tooltip-lazy": benchmarkTooltipProviders,
+    "list": benchmarkListPopulate,
+    "list-remove": benchmarkListRemoval,
+}
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        print(f"== {name}")
+        BENCHMARKS[name]()
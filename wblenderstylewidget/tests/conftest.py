@@ -0,0 +1,50 @@
+import os
+import sys
+
+package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, package_dir)
+sys.path.insert(0, os.path.dirname(package_dir))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt5.QtCore import QEvent, QPointF, Qt
+from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtWidgets import QApplication
+
+@pytest.fixture
+def countCalls(monkeypatch):
+    """ count the calls of `owner.name`, returning a dict updated in place """
+    def count(owner, name: str):
+        counter = {"calls": 0}
+        original = getattr(owner, name)
+
+        def wrapper(self, *args, **kwargs):
+            counter["calls"] += 1
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(owner, name, wrapper)
+        return counter
+    return count
+
+@pytest.fixture
+def drag(qapp, qtbot):
+    """ drag `widget` from `x` by `distance` pixels, `step` pixels per mouse event, holding `modifiers`
+
+    With `wait`, that many milliseconds pass after each event, so that the drag spans several frames.
+    """
+    def send(widget, type, x, buttons, modifiers):
+        event = QMouseEvent(type, QPointF(x, widget.height() / 2), Qt.MouseButton.LeftButton, buttons, modifiers)
+        QApplication.sendEvent(widget, event)
+
+    def drag(widget, distance: int, x: int = 10, modifiers=Qt.KeyboardModifier.NoModifier, step: int = 1,
+             wait: int = 0):
+        send(widget, QEvent.Type.MouseButtonPress, x, Qt.MouseButton.LeftButton, modifiers)
+        step = step if distance > 0 else -step
+        for offset in range(step, distance + step, step):
+            send(widget, QEvent.Type.MouseMove, x + offset, Qt.MouseButton.LeftButton, modifiers)
+            if wait:
+                qtbot.wait(wait)
+        send(widget, QEvent.Type.MouseButtonRelease, x + distance, Qt.MouseButton.NoButton, modifiers)
+        qapp.processEvents()
+    return drag
@@ -0,0 +1,124 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from common.style_sheet import StyleSheetMode, setStyleSheetMode, styleClassRegistry
+from common.theme import themeManager
+from components.widgets import PushButton, RadioButtonGroup, SearchLineEdit, ToggleButton
+
+def test_building_a_widget_styles_each_button_once(qapp, countCalls):
+    updates = countCalls(PushButton, "updateQss")
+    applied = countCalls(PushButton, "setStyleSheet")
+    installs = countCalls(QApplication, "setStyleSheet")
+
+    group = RadioButtonGroup([f"Option {i}" for i in range(10)])
+    edits = [SearchLineEdit() for _ in range(10)]
+    qapp.processEvents()
+
+    assert updates["calls"] == 10 + 2 * len(edits)
+    assert applied["calls"] == 10 + 2 * len(edits)
+    assert installs["calls"] == 0
+
+def test_setters_of_one_turn_are_coalesced(qapp, countCalls):
+    button = PushButton("Button")
+    qapp.processEvents()
+    updates = countCalls(PushButton, "updateQss")
+
+    button.setColor("#101010", "#202020", "#303030")
+    button.setCornerRadius(PushButton.CornerRadiusAlign.LEFT)
+    button.setTextAlign(PushButton.TextAlign.RIGHT)
+    qapp.processEvents()
+
+    assert updates["calls"] == 1
+    assert button.styleSheet() == PushButton.createStyleSheet("QPushButton#PushButton", *button.styleKey())
+
+def test_show_applies_the_pending_update(qapp):
+    button = PushButton("Button")
+    button.setBackgroundColor("#123456")
+    button.show()
+
+    assert button.styleSheet()
+    button.close()
+
+def test_identical_buttons_share_a_style_class_in_application_mode(qapp):
+    styleSheet = qapp.styleSheet()
+    setStyleSheetMode(StyleSheetMode.APPLICATION)
+    try:
+        buttons = [PushButton("Button") for _ in range(3)]
+        qapp.processEvents()
+
+        names = {button.property(styleClassRegistry.PROPERTY) for button in buttons}
+        assert len(names) == 1 and None not in names
+        assert not any(button.styleSheet() for button in buttons)
+    finally:
+        setStyleSheetMode(StyleSheetMode.WIDGET)
+        qapp.setStyleSheet(styleSheet)
+
+def test_toggle_button_toggles_on_click(qtbot):
+    button = ToggleButton("Toggle")
+    qtbot.addWidget(button)
+    received = []
+    button.toggled.connect(received.append)
+
+    qtbot.mouseClick(button, Qt.MouseButton.LeftButton)
+    qtbot.mouseClick(button, Qt.MouseButton.LeftButton)
+
+    assert received == [True, False]
+    assert not button.isChecked()
+
+def test_radio_group_tracks_the_checked_button(qtbot):
+    group = RadioButtonGroup(["A", "B", "C"])
+    qtbot.addWidget(group)
+    changes = []
+    group.currentChanged.connect(changes.append)
+    a, b, c = (group.button_group.button(index) for index in range(3))
+
+    group.setCurrentIndex(2)
+    b.setChecked(True)
+
+    assert changes == [2, 1]
+    assert group.currentIndex() == 1
+    assert [button.isSelected() for button in (a, b, c)] == [False, True, False]
+
+def test_unchecking_the_selected_radio_button_clears_the_group(qtbot):
+    group = RadioButtonGroup(["A", "B"])
+    qtbot.addWidget(group)
+    changes = []
+    group.currentChanged.connect(changes.append)
+
+    group.button_group.button(0).setChecked(False)
+
+    assert changes == [-1]
+    assert group.currentIndex() == -1
+    assert group.button_group.checkedButton() is None
+
+    qtbot.mousePress(group.button_group.button(1), Qt.MouseButton.LeftButton)
+
+    assert group.currentIndex() == 1
+
+def backgroundColor(button: PushButton) -> str:
+    return button.grab().toImage().pixelColor(button.width() // 2, button.height() // 2).name()
+
+def test_button_style_ranks_above_an_ancestor_style_sheet(qtbot):
+    parent = QWidget()
+    qtbot.addWidget(parent)
+    parent.setStyleSheet("QPushButton { background-color: #ff0000; }")
+    button = PushButton(parent=parent)
+    button.resize(80, 30)
+    parent.show()
+    qtbot.wait(10)
+
+    assert backgroundColor(button) == themeManager.color("@widget_color").name()
+
+def test_button_style_survives_a_new_application_style_sheet(qtbot, qapp):
+    button = PushButton()
+    qtbot.addWidget(button)
+    button.resize(80, 30)
+    button.show()
+    qtbot.wait(10)
+    styleSheet = qapp.styleSheet()
+    try:
+        qapp.setStyleSheet("QLabel { color: #123456; }")
+        qtbot.wait(10)
+        assert backgroundColor(button) == themeManager.color("@widget_color").name()
+    finally:
+        qapp.setStyleSheet(styleSheet)
@@ -0,0 +1,48 @@
+from PyQt5.QtCore import Qt
+
+from components.widgets import DragGroup, PlainDoubleSpinBox, ProgressBarSlider
+
+def fields(qtbot, count: int = 3):
+    widgets = [PlainDoubleSpinBox() if index % 2 else ProgressBarSlider(initial_value=0.0) for index in range(count)]
+    for widget in widgets:
+        qtbot.addWidget(widget)
+        widget.resize(200, 24)
+    return widgets
+
+def test_a_linked_drag_edits_every_widget_once_per_frame(qtbot, drag):
+    slider, spinBox, other = fields(qtbot)
+    group = DragGroup([slider, spinBox, other])
+    frames, finished = [], []
+    group.valuesChanged.connect(frames.append)
+    group.editingFinished.connect(lambda: finished.append(True))
+
+    drag(spinBox, 50, modifiers=group.modifier)
+
+    assert spinBox.dragValue() == 0.5
+    assert slider.value() == other.value() == 25.0
+    assert frames and all(set(changed) <= {slider, spinBox, other} for changed in frames)
+    assert finished == [True]
+
+def test_an_unlinked_drag_edits_the_dragged_widget_only(qtbot, drag):
+    slider, spinBox, other = fields(qtbot)
+    group = DragGroup([slider, spinBox, other])
+    frames = []
+    group.valuesChanged.connect(frames.append)
+
+    drag(spinBox, 50, modifiers=Qt.KeyboardModifier.NoModifier)
+
+    assert spinBox.dragValue() == 0.5
+    assert slider.value() == other.value() == 0.0
+    assert frames == []
+
+def test_a_widget_belongs_to_one_group(qtbot):
+    slider, spinBox = fields(qtbot, 2)
+    first = DragGroup([slider, spinBox])
+    second = DragGroup([spinBox])
+
+    assert first.widgets() == [slider]
+    assert second.widgets() == [spinBox]
+    assert spinBox.dragGroup() is second
+
+    second.removeWidget(spinBox)
+    assert spinBox.dragGroup() is None
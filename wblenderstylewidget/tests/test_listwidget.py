@@ -0,0 +1,41 @@
+import pytest
+from PyQt5.QtCore import QItemSelection, QItemSelectionModel
+
+from components.widgets import ListView, ListWidget
+from components.widgets.listwidget import rowRanges
+
+def test_rows_are_grouped_into_contiguous_ranges():
+    assert rowRanges([7, 1, 2, 3, 9, 8, 2, 5]) == [(1, 3), (5, 1), (7, 3)]
+    assert rowRanges([]) == []
+
+@pytest.mark.parametrize("factory", [ListWidget, ListView])
+def test_selected_rows_are_removed_one_range_at_a_time(qtbot, factory):
+    widget = factory()
+    qtbot.addWidget(widget)
+    widget.setSelectionMode(widget.SelectionMode.ExtendedSelection)
+    widget.addItems([str(row) for row in range(10)])
+    model = widget.model()
+    selection = QItemSelection()
+    for first, last in ((1, 3), (6, 6), (8, 9)):
+        selection.select(model.index(first, 0), model.index(last, 0))
+    widget.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.Select)
+    removals = []
+    model.rowsRemoved.connect(lambda parent, first, last: removals.append((first, last)))
+
+    widget.remove_selected_item()
+
+    assert removals == [(8, 9), (6, 6), (1, 3)]
+    assert [model.index(row, 0).data() for row in range(widget.count())] == ["0", "4", "5", "7"]
+
+@pytest.mark.parametrize("factory", [ListWidget, ListView])
+def test_rows_are_inserted_with_one_notification(qtbot, factory):
+    widget = factory()
+    qtbot.addWidget(widget)
+    widget.addItems(["a", "d"])
+    insertions = []
+    widget.model().rowsInserted.connect(lambda parent, first, last: insertions.append((first, last)))
+
+    widget.insertRows(1, iter(["b", "c"]))
+
+    assert insertions == [(1, 2)]
+    assert [widget.model().index(row, 0).data() for row in range(widget.count())] == ["a", "b", "c", "d"]
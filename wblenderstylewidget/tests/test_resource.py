@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+import textwrap
+import zipfile
+
+package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def zipPackage(path: str) -> str:
+    """ zip the package without its tests and compiled files """
+    with zipfile.ZipFile(path, "w") as archive:
+        for root, dirs, files in os.walk(package_dir):
+            dirs[:] = [name for name in dirs if name not in ("__pycache__", "tests")]
+            for name in files:
+                source = os.path.join(root, name)
+                archive.write(source, os.path.join("wblenderstylewidget", os.path.relpath(source, package_dir)))
+    return path
+
+def test_the_package_styles_widgets_from_a_zip_archive(tmp_path):
+    archive = zipPackage(str(tmp_path / "wblenderstylewidget.zip"))
+    script = textwrap.dedent(f"""
+        import os, sys
+        sys.path[:0] = [{archive!r}, {os.path.join(archive, "wblenderstylewidget")!r}]
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+        from PyQt5.QtWidgets import QApplication
+        app = QApplication([])
+        import wblenderstylewidget
+        import common.resource
+        from common.icon import BlenderStyleIcon
+        from common.style_sheet import BlenderStyleSheet
+        from common.theme import themeManager
+        from components.widgets import PushButton
+
+        assert common.resource.__file__.startswith({archive!r}), common.resource.__file__
+        icons = themeManager.variables()["icons"]
+        assert os.path.isfile(os.path.join(icons, "icon_check.svg")), icons
+        assert os.path.isfile(BlenderStyleIcon.CHECK), BlenderStyleIcon.CHECK
+        assert "@" not in BlenderStyleSheet.CHECKBOX.content()
+        PushButton("Button").show()
+        app.processEvents()
+        print("ok")
+    """)
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONPATH"}
+    result = subprocess.run([sys.executable, "-c", script], cwd=str(tmp_path), env=env,
+                            capture_output=True, text=True, timeout=60)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith("ok")
@@ -0,0 +1,29 @@
+from components.widgets import ProgressBarSlider
+
+def test_float_value_has_its_own_signal(qtbot):
+    slider = ProgressBarSlider(minimum=-1, maximum=1, initial_value=0.0)
+    qtbot.addWidget(slider)
+    values, percents = [], []
+    slider.floatValueChanged.connect(values.append)
+    slider.valueChanged.connect(percents.append)
+
+    slider.setValue(0.25)
+    slider.setValue(0.251)
+
+    assert values == [0.25, 0.251]
+    assert percents == [62, 63]
+    assert slider.value() == 0.251
+
+def test_without_tracking_a_slider_drag_commits_once_when_it_ends(qtbot, drag):
+    slider = ProgressBarSlider(minimum=0, maximum=1, initial_value=0.0)
+    qtbot.addWidget(slider)
+    slider.resize(200, 24)
+    slider.setTracking(False)
+    values, finished = [], []
+    slider.floatValueChanged.connect(values.append)
+    slider.editingFinished.connect(lambda: finished.append(slider.value()))
+
+    drag(slider, 100, x=0, step=20, wait=40)
+
+    assert values == [0.5]
+    assert finished == [0.5]
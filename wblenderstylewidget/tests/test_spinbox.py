@@ -0,0 +1,135 @@
+from PyQt5.QtCore import QEvent, QPointF, Qt
+from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtWidgets import QApplication
+
+from components.widgets import ButtonSpinBox, DragGroup, PlainDoubleSpinBox, PlainSpinBox, ProgressBarSlider, VectorSpinBox
+from components.widgets.widget_base import ValueTracking
+
+def mouseEvent(widget, type, x, buttons=Qt.MouseButton.LeftButton):
+    return QMouseEvent(type, QPointF(x, widget.height() / 2), Qt.MouseButton.LeftButton, buttons,
+                       Qt.KeyboardModifier.NoModifier)
+
+def trackedSpinBox(qtbot):
+    spinBox = PlainSpinBox()
+    qtbot.addWidget(spinBox)
+    spinBox.resize(200, 30)
+    changes, finished = [], []
+    spinBox.valueChanged.connect(changes.append)
+    spinBox.editingFinished.connect(lambda: finished.append(spinBox.value))
+    return spinBox, changes, finished
+
+def test_tracking_commits_every_frame_of_a_drag(qtbot, drag):
+    spinBox, changes, finished = trackedSpinBox(qtbot)
+
+    drag(spinBox, 50, step=10, wait=40)
+
+    assert changes == [10, 20, 30, 40, 50]
+    assert finished == [50]
+
+def test_without_tracking_a_drag_commits_once_when_it_ends(qtbot, drag):
+    spinBox, changes, finished = trackedSpinBox(qtbot)
+    spinBox.setTracking(False)
+
+    drag(spinBox, 50, step=10, wait=40)
+
+    assert spinBox.dragValue() == 50
+    assert changes == [50]
+    assert finished == [50]
+
+def test_the_throttle_coalesces_the_commits_of_a_drag(qtbot, drag):
+    spinBox, changes, finished = trackedSpinBox(qtbot)
+    spinBox.setThrottleInterval(10000)
+
+    drag(spinBox, 50, step=10, wait=40)
+
+    # the first frame commits at once, the following ones wait for the interval, the release commits the last
+    assert changes == [10, 50]
+    assert finished == [50]
+
+def test_every_dragged_widget_shares_the_precision_modifier(qtbot, drag):
+    for factory in (PlainSpinBox, PlainDoubleSpinBox, ProgressBarSlider):
+        normal, precise = factory(), factory()
+        for widget in (normal, precise):
+            qtbot.addWidget(widget)
+            widget.resize(200, 24)
+
+        drag(normal, 50, x=0)
+        drag(precise, 50, x=0, modifiers=ValueTracking.PRECISION_MODIFIER)
+
+        assert normal.dragValue() > 0, factory.__name__
+        assert precise.dragValue() == normal.dragValue() * ValueTracking.PRECISION_FACTOR, factory.__name__
+
+def test_vector_spin_box_drags_every_component_with_ctrl(qtbot, drag):
+    vector = VectorSpinBox(("X", "Y", "Z"))
+    qtbot.addWidget(vector)
+    vector.resize(200, vector.height())
+    changes = []
+    vector.valueChanged.connect(changes.append)
+
+    # the drag presses the middle component
+    drag(vector, 20)
+    drag(vector, 20, modifiers=VectorSpinBox.MULTI_EDIT_MODIFIER)
+
+    assert vector.value() == (0.2, 0.4, 0.2)
+    assert changes[-1] == vector.value()
+
+def test_vector_spin_box_drags_with_its_group(qtbot, drag):
+    vector = VectorSpinBox(("X", "Y"))
+    field = PlainDoubleSpinBox()
+    for widget in (vector, field):
+        qtbot.addWidget(widget)
+        widget.resize(200, widget.height())
+    group = DragGroup([vector, field])
+    changes = []
+    group.valuesChanged.connect(changes.append)
+
+    drag(field, 30, modifiers=group.modifier)
+
+    assert field.dragValue() == 0.3
+    assert vector.value() == (0.3, 0.3)
+    assert changes[-1][vector] == (0.3, 0.3)
+
+def test_vector_spin_box_keeps_the_component_on_invalid_input(qtbot):
+    vector = VectorSpinBox(("X", "Y"), value=(1, 2))
+    qtbot.addWidget(vector)
+
+    vector.openEditor(0)
+    vector._editor.setText("abc")
+    vector.closeEditor()
+
+    assert vector.value() == (1.0, 2.0)
+
+def test_hovering_after_a_click_does_not_drag_the_value(qtbot):
+    spinBox = ButtonSpinBox(value=5)
+    qtbot.addWidget(spinBox)
+    spinBox.resize(200, 30)
+    spinBox.show()
+    changes = []
+    spinBox.valueChanged.connect(changes.append)
+
+    # a click on the value opens the editor
+    QApplication.sendEvent(spinBox, mouseEvent(spinBox, QEvent.Type.MouseButtonPress, 100))
+    QApplication.sendEvent(spinBox, mouseEvent(spinBox, QEvent.Type.MouseButtonRelease, 100, Qt.MouseButton.NoButton))
+    assert spinBox.lineEdit().isVisible()
+    for x in (100, 60, 10, 5, 195):
+        QApplication.sendEvent(spinBox, mouseEvent(spinBox, QEvent.Type.MouseMove, x, Qt.MouseButton.NoButton))
+    # the drag motion is applied on the next frame
+    qtbot.wait(50)
+
+    assert spinBox.value == 5
+    assert changes == []
+
+def test_invalid_typed_text_keeps_the_last_value(qtbot, capsys):
+    spinBox = PlainSpinBox()
+    qtbot.addWidget(spinBox)
+    spinBox.setValue(7)
+    finished = []
+    spinBox.editingFinished.connect(lambda: finished.append(spinBox.value))
+
+    spinBox.openLineEdit()
+    spinBox.lineEdit().setText("abc")
+    spinBox.closeLineEdit()
+
+    assert spinBox.value == 7
+    assert finished == [7]
+    assert capsys.readouterr().out == ""
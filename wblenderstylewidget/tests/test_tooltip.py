@@ -0,0 +1,121 @@
+import gc
+import threading
+import weakref
+
+from PyQt5 import sip
+from PyQt5.QtCore import QCoreApplication, QEvent
+from PyQt5.QtWidgets import QWidget
+
+from components.widgets.tooltip import TooltipManager
+
+def test_registry_does_not_keep_widgets_alive(qapp):
+    manager = TooltipManager()
+    widget = QWidget()
+    manager.setToolTip(widget, "Title", "Content")
+    ref = weakref.ref(widget)
+
+    del widget
+    gc.collect()
+
+    assert ref() is None
+    assert len(manager._tooltips) == 0
+
+def test_destroyed_widgets_are_forgotten(qapp):
+    manager = TooltipManager()
+    parent = QWidget()
+    child = QWidget(parent)
+    manager.setToolTip(child, "Title", lambda: "Content")
+    manager.content(child)
+
+    child.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    assert sip.isdeleted(child)
+    assert manager.toolTip(child) is None
+    assert len(manager._contents) == 0
+    manager.removeToolTip(child)
+
+def test_removing_a_tooltip_disconnects_the_widget(qapp):
+    manager = TooltipManager()
+    widget = QWidget()
+    for _ in range(3):
+        manager.setToolTip(widget, "Title", "Content")
+        manager.removeToolTip(widget)
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    assert widget.receivers(widget.destroyed) == 0
+    assert manager.toolTip(widget) is None
+
+def test_stale_background_result_is_discarded(qtbot):
+    manager = TooltipManager()
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    release = threading.Event()
+
+    def provider(text):
+        def compute():
+            release.wait(5)
+            return text
+        return compute
+
+    manager.setToolTip(widget, "Title", provider("stale"), background=True)
+    assert manager.content(widget) is None
+    manager.setToolTip(widget, "Title", provider("fresh"), background=True)
+    assert manager.content(widget) is None
+    release.set()
+
+    qtbot.waitUntil(lambda: not manager._pending)
+    assert manager.content(widget) == ("Title", "fresh", None)
+
+def test_provider_errors_are_logged(qtbot, caplog):
+    manager = TooltipManager()
+    widget = QWidget()
+    qtbot.addWidget(widget)
+
+    def failing():
+        raise ValueError("no data")
+
+    manager.setToolTip(widget, "Title", failing, background=True)
+    manager.content(widget)
+
+    qtbot.waitUntil(lambda: not manager._pending)
+    assert "no data" in caplog.text
+
+def test_quitting_stops_the_worker_threads(qtbot):
+    manager = TooltipManager()
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    manager.setToolTip(widget, "Title", lambda: "Content", background=True)
+    manager.content(widget)
+    executor = manager._executor
+
+    QCoreApplication.instance().aboutToQuit.emit()
+
+    assert manager._executor is None
+    assert executor._shutdown
+
+def test_a_failing_provider_runs_once(qtbot, caplog):
+    manager = TooltipManager()
+    calls = []
+
+    def failing():
+        calls.append(True)
+        raise ValueError("no data")
+
+    for background in (False, True):
+        calls.clear()
+        widget = QWidget()
+        qtbot.addWidget(widget)
+        manager.setToolTip(widget, "Title", failing, background=background)
+        manager.content(widget)
+        qtbot.waitUntil(lambda: not manager._pending)
+
+        for _ in range(3):
+            assert manager.content(widget) is None
+        qtbot.waitUntil(lambda: not manager._pending)
+        assert len(calls) == 1
+
+        manager.invalidateToolTip(widget)
+        manager.content(widget)
+        qtbot.waitUntil(lambda: not manager._pending)
+        assert len(calls) == 2